@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scrape Result Cache
+On-disk cache of scraped profile/company JSON keyed by normalized
+LinkedIn URL, backed by SQLite with a freshness TTL
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Optional
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# LinkedIn profiles change on the order of days; a day-old result is safe
+DEFAULT_TTL = 86400
+
+CACHE_DB = os.path.expanduser("~/.cache/linkedin_scraper/scrape_cache.db")
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a LinkedIn URL into a stable cache key.
+
+    Lowercases the host, drops query string and fragment, and strips the
+    trailing slash so the same profile never caches under two keys.
+    """
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/")
+    return f"{parts.scheme or 'https'}://{host}{path}"
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(CACHE_DB), exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache ("
+        "norm_url TEXT PRIMARY KEY, scraped_at INTEGER, payload BLOB)"
+    )
+    return conn
+
+
+def cache_get(url: str, ttl: int = DEFAULT_TTL) -> Optional[dict]:
+    """Return the cached payload for url if younger than ttl seconds."""
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT scraped_at, payload FROM cache WHERE norm_url = ?",
+            (normalize_url(url),),
+        ).fetchone()
+    if row is None or time.time() - row[0] > ttl:
+        return None
+    payload = row[1]
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def cache_put(url: str, data: dict) -> None:
+    """Store data for url, replacing any previous entry."""
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    with closing(_connect()) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (norm_url, scraped_at, payload) VALUES (?, ?, ?)",
+            (normalize_url(url), int(time.time()), payload),
+        )
+        conn.commit()
+
+
+def cache_clear() -> int:
+    """Drop every cached entry, returning how many were removed."""
+    with closing(_connect()) as conn:
+        removed = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        conn.execute("DELETE FROM cache")
+        conn.commit()
+    return removed
@@ -7,14 +7,24 @@ Supports Firefox, Chrome, and Edge browsers
 Similar to extract_bumble_cookies.py and extract_tinder_cookies.py
 """
 
-from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from glob import glob
-from os.path import expanduser, exists
+from os import makedirs, scandir
+from os.path import dirname, expanduser, exists
 from platform import system
-from sqlite3 import OperationalError, connect
+from sqlite3 import Row, connect
+from threading import Lock
 import json
 import sys
 
+# orjson serializes 2-6x faster than stdlib json; fall back silently if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Color output (simple ASCII for cross-platform compatibility)
 GREEN = "[OK]"
 RED = "[X]"
@@ -24,223 +34,197 @@ CYAN = "[*]"
 # LinkedIn authentication cookie names
 LINKEDIN_AUTH_COOKIES = ['li_at', 'JSESSIONID', 'bcookie', 'bscookie', 'lang', 'li_rm']
 
+# Serializes status output from extraction worker threads
+_PRINT_LOCK = Lock()
+
+# Platform and browser profile locations, resolved once at import so the
+# discovery helpers (all three run in auto-detect mode) don't repeat the
+# platform.system() / expanduser() work per call
+_PLATFORM = system()
+
+if _PLATFORM == "Windows":
+    _FIREFOX_PATTERNS = (
+        expanduser("~/AppData/Roaming/Mozilla/Firefox/Profiles/*/cookies.sqlite"),
+        expanduser("~/AppData/Roaming/Mozilla/Firefox Developer Edition/Profiles/*/cookies.sqlite"),
+    )
+    _CHROME_BASES = (expanduser("~/AppData/Local/Google/Chrome/User Data"),)
+    _EDGE_BASES = (expanduser("~/AppData/Local/Microsoft/Edge/User Data"),)
+elif _PLATFORM == "Darwin":  # macOS
+    _FIREFOX_PATTERNS = (
+        expanduser("~/Library/Application Support/Firefox/Profiles/*/cookies.sqlite"),
+        expanduser("~/Library/Application Support/Firefox Developer Edition/Profiles/*/cookies.sqlite"),
+    )
+    _CHROME_BASES = (expanduser("~/Library/Application Support/Google/Chrome"),)
+    _EDGE_BASES = (expanduser("~/Library/Application Support/Microsoft Edge"),)
+else:  # Linux
+    _FIREFOX_PATTERNS = (
+        expanduser("~/.mozilla/firefox/*/cookies.sqlite"),
+        expanduser("~/.mozilla/firefox-developer-edition/*/cookies.sqlite"),
+    )
+    _CHROME_BASES = (expanduser("~/.config/google-chrome"),)
+    _EDGE_BASES = (expanduser("~/.config/microsoft-edge"),)
+
+
+@lru_cache(maxsize=None)
+def _glob_cached(pattern):
+    """glob() with a process-lifetime cache.
+
+    Auto-detect stats overlapping directories across the three discovery
+    helpers; browsers don't create profiles mid-run, so caching is safe.
+    """
+    return tuple(glob(pattern))
+
+
+@lru_cache(maxsize=None)
+def _exists_cached(path):
+    """os.path.exists() with a process-lifetime cache (see _glob_cached)."""
+    return exists(path)
+
+
+# Path of the cookie file that last produced a successful extraction;
+# trying it first skips browser discovery entirely on repeat runs
+_LAST_PROFILE_CACHE = expanduser("~/.cache/linkedin_scraper/last_profile")
+
 
-def has_linkedin_cookies(cookiefile, is_firefox=True):
-    """Check if a cookie file contains LinkedIn cookies."""
+def _read_last_profile():
+    """Return the cached last-good cookie file path, or None."""
     try:
-        if is_firefox:
-            conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-            try:
-                # Try modern Firefox cookie schema first - check for LinkedIn cookies
-                result = conn.execute(
-                    "SELECT COUNT(*) FROM moz_cookies WHERE (baseDomain='linkedin.com' OR baseDomain='.linkedin.com')"
-                ).fetchone()
-                if result and result[0] > 0:
-                    return True
-            except OperationalError:
-                # Fallback to host-based query
-                result = conn.execute(
-                    "SELECT COUNT(*) FROM moz_cookies WHERE host LIKE '%linkedin.com'"
-                ).fetchone()
-                if result and result[0] > 0:
-                    return True
-        else:
-            # Chrome/Edge cookie schema
-            conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-            result = conn.execute(
-                "SELECT COUNT(*) FROM cookies WHERE host_key LIKE '%linkedin.com'"
-            ).fetchone()
-            if result and result[0] > 0:
-                return True
-        conn.close()
-    except Exception:
-        # Silently fail - don't print warnings during discovery
+        with open(_LAST_PROFILE_CACHE, 'r', encoding='utf-8') as f:
+            path = f.read().strip()
+        return path if path and exists(path) else None
+    except OSError:
+        return None
+
+
+def _write_last_profile(path):
+    """Persist the cookie file that produced a successful extraction."""
+    try:
+        makedirs(dirname(_LAST_PROFILE_CACHE), exist_ok=True)
+        with open(_LAST_PROFILE_CACHE, 'w', encoding='utf-8') as f:
+            f.write(path)
+    except OSError:
         pass
-    return False
+
+
+def _norm_domain(host):
+    """Normalize a cookie host to leading-dot form used by the output JSON."""
+    return host if host.startswith('.') else ('.' + host if '.' in host else host)
+
+
+def _tune(conn):
+    """Apply read-only performance PRAGMAs to a cookie DB connection.
+
+    The defaults (2 MB cache, no mmap) make SQLite pread() every page;
+    letting the OS page cache serve the table via mmap speeds up cold scans.
+    All of these are connection-local, so they are safe with immutable=1.
+    """
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-16000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA query_only=1")
 
 
 def get_firefox_cookie_files():
     """Get Firefox cookie files, checking both regular Firefox and Firefox Developer Edition."""
-    platform = system()
-    
-    # Define all possible Firefox profile locations
-    if platform == "Windows":
-        cookie_patterns = [
-            "~/AppData/Roaming/Mozilla/Firefox/Profiles/*/cookies.sqlite",
-            "~/AppData/Roaming/Mozilla/Firefox Developer Edition/Profiles/*/cookies.sqlite",
-        ]
-    elif platform == "Darwin":  # macOS
-        cookie_patterns = [
-            "~/Library/Application Support/Firefox/Profiles/*/cookies.sqlite",
-            "~/Library/Application Support/Firefox Developer Edition/Profiles/*/cookies.sqlite",
-        ]
-    else:  # Linux
-        cookie_patterns = [
-            "~/.mozilla/firefox/*/cookies.sqlite",
-            "~/.mozilla/firefox-developer-edition/*/cookies.sqlite",
-        ]
-    
     # Collect all cookie files from all locations
+    # (extraction itself weeds out files without LinkedIn cookies, so no
+    # separate probe pass is needed here)
     all_cookiefiles = []
-    for pattern in cookie_patterns:
-        found_files = glob(expanduser(pattern))
-        all_cookiefiles.extend(found_files)
-    
-    if not all_cookiefiles:
+    for pattern in _FIREFOX_PATTERNS:
+        all_cookiefiles.extend(_glob_cached(pattern))
+
+    return all_cookiefiles
+
+
+def _chromium_profile_cookie_files(base_path):
+    """List Cookies files under a Chrome/Edge "User Data" style directory.
+
+    One scandir() pass replaces the previous Default + "Profile *" +
+    "Profile [0-9]*" glob triple, which re-read the same directory three
+    times (and the numbered pattern was a subset of "Profile *" anyway).
+    """
+    cookie_files = []
+    try:
+        with scandir(base_path) as entries:
+            for entry in entries:
+                if entry.is_dir() and (entry.name == 'Default' or entry.name.startswith('Profile ')):
+                    candidate = f"{entry.path}/Cookies"
+                    if _exists_cached(candidate):
+                        cookie_files.append(candidate)
+    except OSError:
         return []
-    
-    # Prioritize cookie files that contain LinkedIn cookies
-    prioritized = []
-    others = []
-    
-    for cookiefile in all_cookiefiles:
-        if has_linkedin_cookies(cookiefile, is_firefox=True):
-            prioritized.append(cookiefile)
-        else:
-            others.append(cookiefile)
-    
-    return prioritized + others
+
+    # Keep Default first to match the old discovery order
+    cookie_files.sort(key=lambda p: '/Default/' not in p.replace('\\', '/'))
+    return cookie_files
 
 
 def get_chrome_cookie_files():
     """Get Chrome cookie files from all profile directories."""
-    platform = system()
-    
-    if platform == "Windows":
-        base_paths = [
-            "~/AppData/Local/Google/Chrome/User Data",
-        ]
-    elif platform == "Darwin":  # macOS
-        base_paths = [
-            "~/Library/Application Support/Google/Chrome",
-        ]
-    else:  # Linux
-        base_paths = [
-            "~/.config/google-chrome",
-        ]
-    
     cookie_files = []
-    for base_path in base_paths:
-        expanded_base = expanduser(base_path)
-        if not exists(expanded_base):
-            continue
-        
-        # Check Default profile first
-        default_cookies = expanduser(f"{base_path}/Default/Cookies")
-        if exists(default_cookies):
-            cookie_files.append(default_cookies)
-        
-        # Check other profiles
-        profile_pattern = expanduser(f"{base_path}/Profile */Cookies")
-        cookie_files.extend(glob(profile_pattern))
-        
-        # Also check numbered profiles
-        numbered_pattern = expanduser(f"{base_path}/Profile [0-9]*/Cookies")
-        cookie_files.extend(glob(numbered_pattern))
-    
-    # Prioritize cookie files that contain LinkedIn cookies
-    prioritized = []
-    others = []
-    
-    for cookiefile in cookie_files:
-        if has_linkedin_cookies(cookiefile, is_firefox=False):
-            prioritized.append(cookiefile)
-        else:
-            others.append(cookiefile)
+    for base_path in _CHROME_BASES:
+        cookie_files.extend(_chromium_profile_cookie_files(base_path))
     
-    return prioritized + others
+    return cookie_files
 
 
 def get_edge_cookie_files():
     """Get Edge cookie files from all profile directories."""
-    platform = system()
-    
-    if platform == "Windows":
-        base_paths = [
-            "~/AppData/Local/Microsoft/Edge/User Data",
-        ]
-    elif platform == "Darwin":  # macOS
-        base_paths = [
-            "~/Library/Application Support/Microsoft Edge",
-        ]
-    else:  # Linux
-        base_paths = [
-            "~/.config/microsoft-edge",
-        ]
-    
     cookie_files = []
-    for base_path in base_paths:
-        expanded_base = expanduser(base_path)
-        if not exists(expanded_base):
-            continue
-        
-        # Check Default profile first
-        default_cookies = expanduser(f"{base_path}/Default/Cookies")
-        if exists(default_cookies):
-            cookie_files.append(default_cookies)
-        
-        # Check other profiles
-        profile_pattern = expanduser(f"{base_path}/Profile */Cookies")
-        cookie_files.extend(glob(profile_pattern))
-        
-        # Also check numbered profiles
-        numbered_pattern = expanduser(f"{base_path}/Profile [0-9]*/Cookies")
-        cookie_files.extend(glob(numbered_pattern))
+    for base_path in _EDGE_BASES:
+        cookie_files.extend(_chromium_profile_cookie_files(base_path))
     
-    # Prioritize cookie files that contain LinkedIn cookies
-    prioritized = []
-    others = []
-    
-    for cookiefile in cookie_files:
-        if has_linkedin_cookies(cookiefile, is_firefox=False):
-            prioritized.append(cookiefile)
-        else:
-            others.append(cookiefile)
-    
-    return prioritized + others
+    return cookie_files
 
 
 def extract_cookies_from_firefox(cookiefile):
     """Extract LinkedIn cookies from Firefox cookie database."""
     try:
-        conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-        
-        # Try multiple query strategies
-        queries = [
-            # Try baseDomain first (modern Firefox schema)
-            "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE (baseDomain='linkedin.com' OR baseDomain='.linkedin.com')",
-            # Fallback to host-based query
-            "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE (host='linkedin.com' OR host='.linkedin.com' OR host='www.linkedin.com' OR host LIKE '%.linkedin.com')",
-            # Try with any LinkedIn domain
-            "SELECT name, value, host, path, expiry, isSecure, isHttpOnly FROM moz_cookies WHERE host LIKE '%linkedin.com'",
-        ]
-        
-        for query in queries:
-            try:
-                cursor = conn.execute(query)
-                rows = cursor.fetchall()
-                
-                if rows:
-                    cookies = []
-                    for row in rows:
-                        cookie = {
-                            'name': row[0],
-                            'value': row[1],
-                            'domain': row[2] if row[2].startswith('.') else f".{row[2]}" if not row[2].startswith('.') and '.' in row[2] else row[2],
-                            'path': row[3] or '/',
-                            'expiry': row[4] if row[4] else None,
-                            'secure': bool(row[5]) if row[5] is not None else True,
-                            'httpOnly': bool(row[6]) if row[6] is not None else False,
-                        }
-                        cookies.append(cookie)
-                    
-                    conn.close()
-                    return cookies
-            except OperationalError:
-                continue
-        
-        conn.close()
-        
+        # One connection per file covers schema detect + SELECT; closing()
+        # guarantees release on every path, and cached_statements=0 skips the
+        # statement-LRU bookkeeping a one-shot query never benefits from
+        with closing(connect(f"file:{cookiefile}?immutable=1", uri=True,
+                             cached_statements=0, check_same_thread=False)) as conn:
+            _tune(conn)
+            conn.row_factory = Row
+
+            # Detect the schema once instead of trying progressively broader
+            # queries and throwing away failed prepares
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(moz_cookies)")}
+            if not cols:
+                return None
+
+            if 'baseDomain' in cols:
+                # Modern Firefox schema
+                query = (
+                    "SELECT name, value, host, path, expiry, isSecure, isHttpOnly "
+                    "FROM moz_cookies WHERE (baseDomain='linkedin.com' OR baseDomain='.linkedin.com')"
+                )
+            else:
+                # Fallback to host-based query
+                query = (
+                    "SELECT name, value, host, path, expiry, isSecure, isHttpOnly "
+                    "FROM moz_cookies WHERE host LIKE '%linkedin.com'"
+                )
+
+            # Stream rows straight off the cursor; fetchall() would buffer
+            # the whole result in an extra list before conversion
+            cookies = [
+                {
+                    'name': row['name'],
+                    'value': row['value'],
+                    'domain': _norm_domain(row['host']),
+                    'path': row['path'] or '/',
+                    'expiry': row['expiry'] if row['expiry'] else None,
+                    'secure': bool(row['isSecure']) if row['isSecure'] is not None else True,
+                    'httpOnly': bool(row['isHttpOnly']) if row['isHttpOnly'] is not None else False,
+                }
+                for row in conn.execute(query)
+            ]
+
+            if cookies:
+                return cookies
+
     except Exception as e:
         print(f"{YELLOW} Warning: Could not extract from Firefox {cookiefile}: {e}")
     return None
@@ -249,61 +233,73 @@ def extract_cookies_from_firefox(cookiefile):
 def extract_cookies_from_chrome_edge(cookiefile):
     """Extract LinkedIn cookies from Chrome/Edge cookie database."""
     try:
-        # Try read-only access first
-        conn = connect(f"file:{cookiefile}?immutable=1", uri=True)
-        
-        queries = [
-            "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly FROM cookies WHERE host_key LIKE '%linkedin.com'",
-            "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly FROM cookies WHERE host_key LIKE '%.linkedin.com'",
-            "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly FROM cookies WHERE host_key='www.linkedin.com'",
-        ]
-        
-        for query in queries:
-            try:
-                cursor = conn.execute(query)
-                rows = cursor.fetchall()
-                
-                if rows:
-                    cookies = []
-                    for row in rows:
-                        host_key = row[2]
-                        # Chrome/Edge uses host_key directly (no dot prefix needed)
-                        domain = host_key if host_key.startswith('.') else f".{host_key}" if '.' in host_key else host_key
-                        
-                        # Handle encrypted values (Chrome/Edge may encrypt on Windows/macOS)
-                        cookie_value = row[1]
-                        if isinstance(cookie_value, bytes):
-                            try:
-                                cookie_value = cookie_value.decode('utf-8')
-                            except UnicodeDecodeError:
-                                # Value is encrypted, skip this cookie
-                                continue
-                        
-                        cookie = {
-                            'name': row[0],
-                            'value': cookie_value,
-                            'domain': domain,
-                            'path': row[3] or '/',
-                            'expiry': row[4] if row[4] else None,
-                            'secure': bool(row[5]) if row[5] is not None else True,
-                            'httpOnly': bool(row[6]) if row[6] is not None else False,
-                        }
-                        cookies.append(cookie)
-                    
-                    conn.close()
-                    return cookies
-            except OperationalError:
-                continue
-            except Exception:
-                continue
-        
-        conn.close()
-        
+        # Read-only, single connection for schema probe + SELECT (see the
+        # Firefox extractor for the connect-flag rationale)
+        with closing(connect(f"file:{cookiefile}?immutable=1", uri=True,
+                             cached_statements=0, check_same_thread=False)) as conn:
+            _tune(conn)
+            conn.row_factory = Row
+
+            # Verify the Chrome/Edge schema once; the host-LIKE query below is a
+            # superset of the narrower domain variants, so one SELECT suffices
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(cookies)")}
+            if 'host_key' not in cols:
+                return None
+
+            query = (
+                "SELECT name, value, host_key, path, expires_utc, is_secure, is_httponly "
+                "FROM cookies WHERE host_key LIKE '%linkedin.com'"
+            )
+
+            # Stream rows straight off the cursor rather than fetchall()
+            cookies = []
+            for row in conn.execute(query):
+                # Handle encrypted values (Chrome/Edge may encrypt on Windows/macOS):
+                # a branch on the v10/v11/v20 magic prefix skips them without
+                # paying for a raised-and-caught UnicodeDecodeError per row
+                cookie_value = row['value']
+                if isinstance(cookie_value, bytes):
+                    if cookie_value[:3] in (b'v10', b'v11', b'v20'):
+                        # Value is encrypted, skip this cookie
+                        continue
+                    cookie_value = cookie_value.decode('utf-8', 'ignore')
+
+                cookies.append({
+                    'name': row['name'],
+                    'value': cookie_value,
+                    'domain': _norm_domain(row['host_key']),
+                    'path': row['path'] or '/',
+                    'expiry': row['expires_utc'] if row['expires_utc'] else None,
+                    'secure': bool(row['is_secure']) if row['is_secure'] is not None else True,
+                    'httpOnly': bool(row['is_httponly']) if row['is_httponly'] is not None else False,
+                })
+
+            if cookies:
+                return cookies
+
     except Exception as e:
         print(f"{YELLOW} Warning: Could not extract from Chrome/Edge {cookiefile}: {e}")
     return None
 
 
+def _extract_one(cookiefile, quiet=False):
+    """Extract LinkedIn cookies from a single cookie file (thread worker)."""
+    if not quiet:
+        with _PRINT_LOCK:
+            print(f"{CYAN} Checking: {cookiefile}")
+
+    lowered = cookiefile.lower()
+    if 'firefox' in lowered or 'mozilla' in lowered:
+        cookies = extract_cookies_from_firefox(cookiefile)
+    else:
+        cookies = extract_cookies_from_chrome_edge(cookiefile)
+
+    if cookies and not quiet:
+        with _PRINT_LOCK:
+            print(f"{GREEN} Found {len(cookies)} LinkedIn cookie(s)")
+    return cookies
+
+
 def extract_linkedin_cookies(browser=None, output_file='linkedin_cookies.json', quiet=False):
     """
     Extract LinkedIn cookies from browser cookie databases.
@@ -318,12 +314,33 @@ def extract_linkedin_cookies(browser=None, output_file='linkedin_cookies.json',
     """
     if not quiet:
         print(f"{CYAN} Extracting LinkedIn cookies from browser...")
-    
+
+    seen = {}
+    good_file = None
+
+    # Fast path: re-use the cookie file that worked last run - for the
+    # usual single-profile setup this bypasses discovery altogether.
+    # Only a file that still holds the session cookies counts as a hit;
+    # a logged-out profile with stray bcookie/lang must not shadow the
+    # profile that actually has the login
+    cached_hit = False
+    if not browser:
+        cached_file = _read_last_profile()
+        if cached_file:
+            cookies = _extract_one(cached_file, quiet)
+            if cookies and {'li_at', 'JSESSIONID'} <= {c['name'] for c in cookies}:
+                for cookie in cookies:
+                    seen.setdefault((cookie['name'], cookie['domain']), cookie)
+                good_file = cached_file
+                cached_hit = True
+
     cookie_files = []
     browser_name = ""
-    
-    # Determine which browser to check
-    if browser and browser.lower() == 'firefox':
+
+    # Determine which browser to check (skipped when the cached file hit)
+    if cached_hit:
+        pass
+    elif browser and browser.lower() == 'firefox':
         cookie_files = get_firefox_cookie_files()
         browser_name = "Firefox"
     elif browser and browser.lower() == 'chrome':
@@ -355,47 +372,39 @@ def extract_linkedin_cookies(browser=None, output_file='linkedin_cookies.json',
                     cookie_files = edge_files
                     browser_name = "Edge"
     
-    if not cookie_files:
+    if not cookie_files and not seen:
         if not quiet:
             print(f"{RED} Error: No browser cookie files found")
             print(f"{YELLOW} Please make sure you are logged into LinkedIn in your browser")
         return None
     
-    if not quiet:
-        print(f"{CYAN} Checking {len(cookie_files)} cookie file(s) from {browser_name}...")
-    
-    # Try to extract cookies from each file until we find LinkedIn cookies
-    all_cookies = []
-    for cookiefile in cookie_files:
+    if cookie_files:
         if not quiet:
-            print(f"{CYAN} Checking: {cookiefile}")
-        
-        cookies = None
-        if 'firefox' in cookiefile.lower() or 'mozilla' in cookiefile.lower():
-            cookies = extract_cookies_from_firefox(cookiefile)
-        else:
-            cookies = extract_cookies_from_chrome_edge(cookiefile)
-        
-        if cookies:
-            all_cookies.extend(cookies)
-            if not quiet:
-                print(f"{GREEN} Found {len(cookies)} LinkedIn cookie(s)")
-    
-    if not all_cookies:
+            print(f"{CYAN} Checking {len(cookie_files)} cookie file(s) from {browser_name}...")
+
+        # Extract from all files in parallel - each file is an independent
+        # SQLite open bound on disk I/O, and sqlite3 releases the GIL during
+        # C-level queries, so threads overlap the per-file latency.
+        # Deduplicate by (name, domain) while aggregating: setdefault keeps the
+        # first occurrence, so no second pass over the cookies is needed.
+        with ThreadPoolExecutor(max_workers=min(8, len(cookie_files))) as executor:
+            for cookiefile, cookies in zip(
+                cookie_files, executor.map(lambda f: _extract_one(f, quiet), cookie_files)
+            ):
+                if cookies:
+                    for cookie in cookies:
+                        seen.setdefault((cookie['name'], cookie['domain']), cookie)
+                    if good_file is None:
+                        good_file = cookiefile
+
+    if not seen:
         if not quiet:
             print(f"{RED} Error: No LinkedIn cookies found")
             print(f"{YELLOW} Please make sure you are logged into LinkedIn in your browser")
         return None
     
-    # Remove duplicates (keep first occurrence)
-    seen = set()
-    unique_cookies = []
-    for cookie in all_cookies:
-        key = (cookie['name'], cookie['domain'])
-        if key not in seen:
-            seen.add(key)
-            unique_cookies.append(cookie)
-    
+    unique_cookies = list(seen.values())
+
     # Check if any authentication cookies were found
     auth_cookie_names = ['li_at', 'JSESSIONID', 'bcookie', 'bscookie']
     found_auth_cookies = any(c['name'] in auth_cookie_names for c in unique_cookies)
@@ -407,9 +416,16 @@ def extract_linkedin_cookies(browser=None, output_file='linkedin_cookies.json',
     
     # Save cookies to file
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(unique_cookies, f, indent=2, ensure_ascii=False)
-        
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(unique_cookies, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(unique_cookies, f, indent=2, ensure_ascii=False)
+
+        if good_file:
+            _write_last_profile(good_file)
+
         if not quiet:
             print(f"{GREEN} Extracted {len(unique_cookies)} unique LinkedIn cookie(s)")
             print(f"{GREEN} Cookies saved to: {output_file}")
@@ -423,23 +439,68 @@ def extract_linkedin_cookies(browser=None, output_file='linkedin_cookies.json',
         return None
 
 
+_USAGE = """\
+usage: extract_linkedin_cookies.py [-h] [-b {firefox,chrome,edge}] [-o OUTPUT] [-q]
+
+Extract LinkedIn cookies from browser
+
+options:
+  -h, --help            show this help message and exit
+  -b, --browser {firefox,chrome,edge}
+                        Preferred browser (default: auto-detect)
+  -o, --output OUTPUT   Output file path (default: linkedin_cookies.json)
+  -q, --quiet           Suppress non-error output"""
+
+
 def main():
-    parser = ArgumentParser(description="Extract LinkedIn cookies from browser")
-    parser.add_argument('-b', '--browser', choices=['firefox', 'chrome', 'edge'],
-                       help='Preferred browser (default: auto-detect)')
-    parser.add_argument('-o', '--output', default='linkedin_cookies.json',
-                       help='Output file path (default: linkedin_cookies.json)')
-    parser.add_argument('-q', '--quiet', action='store_true',
-                       help='Suppress non-error output')
-    
-    args = parser.parse_args()
-    
+    # Flags are parsed by hand: importing and building an ArgumentParser
+    # costs ~30-40ms of cold start, longer than a warm single-profile
+    # extraction when this script is invoked per-scrape in a loop
+    browser = None
+    output = 'linkedin_cookies.json'
+    quiet = False
+
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        # Accept the --flag=value spelling argparse also allowed
+        value = None
+        if arg.startswith('--') and '=' in arg:
+            arg, _, value = arg.partition('=')
+        if arg in ('-h', '--help'):
+            print(_USAGE)
+            sys.exit(0)
+        elif arg in ('-b', '--browser'):
+            if value is None:
+                i += 1
+                value = args[i] if i < len(args) else None
+            if value not in ('firefox', 'chrome', 'edge'):
+                print(f"{RED} Error: -b/--browser expects one of: firefox, chrome, edge")
+                sys.exit(2)
+            browser = value
+        elif arg in ('-o', '--output'):
+            if value is None:
+                i += 1
+                value = args[i] if i < len(args) else None
+            if value is None:
+                print(f"{RED} Error: -o/--output expects a file path")
+                sys.exit(2)
+            output = value
+        elif arg in ('-q', '--quiet'):
+            quiet = True
+        else:
+            print(f"{RED} Error: Unrecognized argument: {arg}")
+            print(_USAGE)
+            sys.exit(2)
+        i += 1
+
     result = extract_linkedin_cookies(
-        browser=args.browser,
-        output_file=args.output,
-        quiet=args.quiet
+        browser=browser,
+        output_file=output,
+        quiet=quiet
     )
-    
+
     if result:
         sys.exit(0)
     else:
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn Scraper Daemon
+Keeps a warm authenticated browser in memory and serves scrape requests
+over a unix socket, so CLI calls skip the multi-second Chromium cold start
+"""
+
+import asyncio
+import functools
+import json
+import sys
+import argparse
+from pathlib import Path
+
+from linkedin_scraper_wrapper import _person_to_dict, _company_to_dict, _job_to_dict
+
+DEFAULT_SOCKET = "/tmp/linkedin_scraper.sock"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_scrapers() -> None:
+    """Import the Playwright-backed scraper stack on first serve.
+
+    The thin-client path (request/DEFAULT_SOCKET) must stay importable
+    on machines without Playwright, so only the server side pulls in
+    linkedin_scraper; names are injected into module globals.
+    """
+    import linkedin_scraper as _ls
+
+    globals().update(
+        BrowserManager=_ls.BrowserManager,
+        PersonScraper=_ls.PersonScraper,
+        CompanyScraper=_ls.CompanyScraper,
+        JobSearchScraper=_ls.JobSearchScraper,
+    )
+
+
+async def _handle_request(browser, request: dict) -> dict:
+    """Dispatch one {op, ...} request against the warm browser."""
+    op = request.get("op")
+
+    if op == "ping":
+        return {"ok": True, "data": "pong"}
+
+    # Each request gets a throwaway page in the authenticated context;
+    # the browser and session survive across requests
+    if op == "person":
+        page = await browser.context.new_page()
+        try:
+            person = await PersonScraper(page).scrape(request["url"])
+            return {"ok": True, "data": _person_to_dict(person)}
+        finally:
+            await page.close()
+    elif op == "company":
+        page = await browser.context.new_page()
+        try:
+            company = await CompanyScraper(page).scrape(request["url"])
+            return {"ok": True, "data": _company_to_dict(company)}
+        finally:
+            await page.close()
+    elif op == "jobs":
+        page = await browser.context.new_page()
+        try:
+            jobs = await JobSearchScraper(page).search(
+                keywords=request["keywords"],
+                location=request.get("location"),
+                limit=request.get("limit", 10),
+            )
+            return {"ok": True, "data": [_job_to_dict(job) for job in jobs]}
+        finally:
+            await page.close()
+
+    return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+async def serve(
+    socket_path: str = DEFAULT_SOCKET,
+    session_file: str = "linkedin_session.json",
+    headless: bool = True,
+):
+    """Run the scrape daemon until interrupted.
+
+    The browser is launched and the session loaded exactly once; every
+    connection then reuses them, which eliminates the per-invocation
+    cold start the one-shot CLI pays.
+    """
+    _load_scrapers()
+    browser = BrowserManager(headless=headless)
+    await browser.start()
+
+    if Path(session_file).exists():
+        await browser.load_session(session_file)
+        print(f"[OK] Loaded session from {session_file}")
+    else:
+        print(f"[!] Session file not found: {session_file}")
+        print("[!] Serving unauthenticated - scrapes will likely hit the authwall")
+
+    async def handle(reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response = {"ok": False, "error": f"Bad request: {e}"}
+                else:
+                    try:
+                        response = await _handle_request(browser, request)
+                    except Exception as e:
+                        response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    # Clear a stale socket from a previous run
+    Path(socket_path).unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    print(f"[OK] Daemon listening on {socket_path}")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await browser.close()
+        Path(socket_path).unlink(missing_ok=True)
+
+
+async def request(payload: dict, socket_path: str = DEFAULT_SOCKET) -> dict:
+    """Send one request to a running daemon and return its response."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    try:
+        writer.write(json.dumps(payload).encode("utf-8") + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+        if not line:
+            return {"ok": False, "error": "Daemon closed the connection"}
+        return json.loads(line)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LinkedIn Scraper Daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument("--session", default="linkedin_session.json", help="Session file path")
+    parser.add_argument("--headless", action="store_true", default=True, help="Run in headless mode")
+    parser.add_argument("--no-headless", dest="headless", action="store_false", help="Show browser window")
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.socket, args.session, args.headless))
+    except KeyboardInterrupt:
+        print("\n[*] Daemon stopped")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
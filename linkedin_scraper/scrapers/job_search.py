@@ -4,7 +4,7 @@ Job search scraper for LinkedIn.
 Searches for jobs on LinkedIn and extracts job URLs.
 """
 import logging
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from urllib.parse import urlencode
 from playwright.async_api import Page
 
@@ -83,6 +83,52 @@ class JobSearchScraper(BaseScraper):
         logger.info(f"Job search complete: found {len(job_urls)} jobs")
         return job_urls
     
+    async def search_iter(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        limit: int = 25
+    ) -> AsyncIterator[str]:
+        """
+        Search for jobs, yielding each URL as it is extracted.
+        
+        Streaming variant of search() for callers that write results
+        incrementally instead of collecting the full list first.
+        
+        Args:
+            keywords: Job search keywords (e.g., "software engineer")
+            location: Job location (e.g., "San Francisco, CA")
+            limit: Maximum number of job URLs to yield
+            
+        Yields:
+            Job posting URLs
+        """
+        logger.info(f"Starting job search (streaming): keywords='{keywords}', location='{location}'")
+        
+        # Build search URL
+        search_url = self._build_search_url(keywords, location)
+        await self.callback.on_start("JobSearch", search_url)
+        
+        # Navigate to search results
+        await self.navigate_and_wait(search_url)
+        await self.callback.on_progress("Navigated to search results", 20)
+        
+        # Wait for job listings to load
+        await self.page.wait_for_selector('.jobs-search__results-list', timeout=10000)
+        await self.wait_and_focus(1)
+        
+        # Scroll to load more results
+        await self.scroll_page_to_bottom(pause_time=1, max_scrolls=3)
+        await self.callback.on_progress("Loaded job listings", 50)
+        
+        count = 0
+        async for job_url in self._iter_job_urls(limit):
+            count += 1
+            yield job_url
+        
+        await self.callback.on_progress("Search complete", 100)
+        logger.info(f"Job search complete: found {count} jobs")
+    
     def _build_search_url(
         self,
         keywords: Optional[str] = None,
@@ -111,36 +157,48 @@ class JobSearchScraper(BaseScraper):
         Returns:
             List of job posting URLs
         """
-        job_urls = []
+        return [job_url async for job_url in self._iter_job_urls(limit)]
+    
+    async def _iter_job_urls(self, limit: int) -> AsyncIterator[str]:
+        """
+        Yield cleaned, deduplicated job URLs from search results.
+        
+        Args:
+            limit: Maximum number of URLs to yield
+            
+        Yields:
+            Job posting URLs
+        """
+        extracted = 0
         
         try:
             # Find all job cards/links
             job_links = await self.page.locator('a[href*="/jobs/view/"]').all()
-            
-            seen_urls = set()
-            for link in job_links:
-                if len(job_urls) >= limit:
-                    break
-                
-                try:
-                    href = await link.get_attribute('href')
-                    if href and '/jobs/view/' in href:
-                        # Clean URL (remove query params)
-                        clean_url = href.split('?')[0] if '?' in href else href
-                        
-                        # Ensure full URL
-                        if not clean_url.startswith('http'):
-                            clean_url = f"https://www.linkedin.com{clean_url}"
-                        
-                        # Avoid duplicates
-                        if clean_url not in seen_urls:
-                            job_urls.append(clean_url)
-                            seen_urls.add(clean_url)
-                except Exception as e:
-                    logger.debug(f"Error extracting job URL: {e}")
-                    continue
-        
         except Exception as e:
             logger.warning(f"Error extracting job URLs: {e}")
+            return
         
-        return job_urls
+        seen_urls = set()
+        for link in job_links:
+            if extracted >= limit:
+                break
+            
+            try:
+                href = await link.get_attribute('href')
+            except Exception as e:
+                logger.debug(f"Error extracting job URL: {e}")
+                continue
+            
+            if href and '/jobs/view/' in href:
+                # Clean URL (remove query params)
+                clean_url = href.split('?')[0] if '?' in href else href
+                
+                # Ensure full URL
+                if not clean_url.startswith('http'):
+                    clean_url = f"https://www.linkedin.com{clean_url}"
+                
+                # Avoid duplicates
+                if clean_url not in seen_urls:
+                    seen_urls.add(clean_url)
+                    extracted += 1
+                    yield clean_url
@@ -7,13 +7,41 @@ Generates realistic real estate broker profile data for demonstrations
 
 import asyncio
 import json
+import os
 import sys
 import argparse
+import pickle
 import random
-from pathlib import Path
-from datetime import datetime, timedelta
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from time import time_ns
+from datetime import datetime
 from typing import Optional, List
 
+# orjson encodes in C, 2-3x faster than stdlib json on these nested dicts;
+# fall back silently when the wheel is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy lets bulk generation draw all random indices for a batch in a few
+# vectorized calls instead of ~30 scalar random.* calls per profile
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# uvloop (optional) swaps in libuv's C event loop for every asyncio.run
+# below; it cuts per-callback scheduling overhead under gather-heavy
+# multi-profile runs, most visibly when --delay is near zero
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Real estate broker seed data (based on actual profiles)
 REAL_ESTATE_BROKER_SEEDS = [
     {
@@ -54,84 +82,396 @@ REAL_ESTATE_BROKER_SEEDS = [
     },
 ]
 
-# Real estate broker data pools
-FIRST_NAMES = [
-    "John", "Sarah", "Michael", "Emily", "David", "Jessica", "James", "Amanda",
-    "Robert", "Jennifer", "William", "Lisa", "Richard", "Michelle", "Joseph", "Ashley",
-    "Thomas", "Melissa", "Christopher", "Nicole", "Daniel", "Stephanie", "Matthew", "Rachel",
-    "Anthony", "Lauren", "Mark", "Kimberly", "Donald", "Amy", "Steven", "Angela",
-    "Hanna", "Marty", "Christian", "Vincent", "Greg", "Jonathan"
-]
+# The static pools hold ~200 string literals; re-evaluating them on
+# every import matters for process-pool workers that import this module
+# per process. With LINKEDIN_MOCK_CACHE=1 the built pools are pickled
+# next to the module and later imports load the blob instead. Off by
+# default so editing the literals during development never goes stale.
+_POOLS_CACHE = os.path.splitext(os.path.abspath(__file__))[0] + ".pools.pkl"
 
-LAST_NAMES = [
-    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor",
-    "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris", "Sanchez",
-    "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young", "Allen", "King",
-    "Mamigonian", "Diaz", "Ortiz", "Mazin", "Balog"
-]
 
-REAL_ESTATE_COMPANIES = [
-    "Coldwell Banker", "Keller Williams", "RE/MAX", "Century 21", "Berkshire Hathaway HomeServices",
-    "Compass", "Sotheby's International Realty", "Douglas Elliman", "Corcoran", "The Agency",
-    "Redfin", "Zillow Premier Agent", "Windermere Real Estate", "Long & Foster", "Howard Hanna",
-    "ERA Real Estate", "Better Homes and Gardens Real Estate", "EXIT Realty", "Realty ONE Group"
-]
+def _build_pools():
+    # Real estate broker data pools
+    FIRST_NAMES = (
+        "John", "Sarah", "Michael", "Emily", "David", "Jessica", "James", "Amanda",
+        "Robert", "Jennifer", "William", "Lisa", "Richard", "Michelle", "Joseph", "Ashley",
+        "Thomas", "Melissa", "Christopher", "Nicole", "Daniel", "Stephanie", "Matthew", "Rachel",
+        "Anthony", "Lauren", "Mark", "Kimberly", "Donald", "Amy", "Steven", "Angela",
+        "Hanna", "Marty", "Christian", "Vincent", "Greg", "Jonathan"
+    )
 
-CITIES = [
-    "San Francisco, CA", "New York, NY", "Los Angeles, CA", "Chicago, IL", "Houston, TX",
-    "Phoenix, AZ", "Philadelphia, PA", "San Antonio, TX", "San Diego, CA", "Dallas, TX",
-    "Austin, TX", "Jacksonville, FL", "Fort Worth, TX", "Columbus, OH", "Charlotte, NC",
-    "San Jose, CA", "Seattle, WA", "Denver, CO", "Boston, MA", "Nashville, TN",
-    "Miami, FL", "Atlanta, GA", "Portland, OR", "Las Vegas, NV", "Tampa, FL"
-]
+    LAST_NAMES = (
+        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+        "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor",
+        "Moore", "Jackson", "Martin", "Lee", "Thompson", "White", "Harris", "Sanchez",
+        "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young", "Allen", "King",
+        "Mamigonian", "Diaz", "Ortiz", "Mazin", "Balog"
+    )
 
-JOB_TITLES = [
-    "Real Estate Broker", "Licensed Real Estate Agent", "Senior Real Estate Advisor",
-    "Luxury Real Estate Specialist", "Commercial Real Estate Broker", "Residential Real Estate Agent",
-    "Real Estate Sales Associate", "Real Estate Consultant", "Property Investment Advisor",
-    "Real Estate Professional", "Associate Broker", "Real Estate Sales Representative"
-]
+    REAL_ESTATE_COMPANIES = (
+        "Coldwell Banker", "Keller Williams", "RE/MAX", "Century 21", "Berkshire Hathaway HomeServices",
+        "Compass", "Sotheby's International Realty", "Douglas Elliman", "Corcoran", "The Agency",
+        "Redfin", "Zillow Premier Agent", "Windermere Real Estate", "Long & Foster", "Howard Hanna",
+        "ERA Real Estate", "Better Homes and Gardens Real Estate", "EXIT Realty", "Realty ONE Group"
+    )
 
-SKILLS = [
-    "Real Estate", "Property Management", "Real Estate Investment", "Sales", "Negotiation",
-    "Market Analysis", "Client Relations", "Property Valuation", "Contract Negotiation",
-    "Residential Real Estate", "Commercial Real Estate", "Luxury Properties", "Foreclosures",
-    "Short Sales", "First Time Home Buyers", "Investment Properties", "Property Marketing",
-    "Real Estate Law", "Mortgage Lending", "Home Staging", "Real Estate Photography",
-    "Lead Generation", "Customer Service", "Communication", "Networking"
-]
+    # Cities kept as (city, state) pairs so the bare city name never needs a
+    # per-call split(','); CITIES below derives the display strings once
+    CITY_PARTS = (
+        ("San Francisco", "CA"), ("New York", "NY"), ("Los Angeles", "CA"), ("Chicago", "IL"),
+        ("Houston", "TX"), ("Phoenix", "AZ"), ("Philadelphia", "PA"), ("San Antonio", "TX"),
+        ("San Diego", "CA"), ("Dallas", "TX"), ("Austin", "TX"), ("Jacksonville", "FL"),
+        ("Fort Worth", "TX"), ("Columbus", "OH"), ("Charlotte", "NC"), ("San Jose", "CA"),
+        ("Seattle", "WA"), ("Denver", "CO"), ("Boston", "MA"), ("Nashville", "TN"),
+        ("Miami", "FL"), ("Atlanta", "GA"), ("Portland", "OR"), ("Las Vegas", "NV"),
+        ("Tampa", "FL")
+    )
 
-SCHOOLS = [
-    "University of California, Berkeley", "New York University", "University of Southern California",
-    "University of Texas at Austin", "University of Miami", "Arizona State University",
-    "University of Washington", "Boston University", "University of Colorado Boulder",
-    "Florida State University", "Georgia State University", "Portland State University"
-]
+    JOB_TITLES = (
+        "Real Estate Broker", "Licensed Real Estate Agent", "Senior Real Estate Advisor",
+        "Luxury Real Estate Specialist", "Commercial Real Estate Broker", "Residential Real Estate Agent",
+        "Real Estate Sales Associate", "Real Estate Consultant", "Property Investment Advisor",
+        "Real Estate Professional", "Associate Broker", "Real Estate Sales Representative"
+    )
 
-DEGREES = [
-    "Bachelor of Science in Business Administration",
-    "Bachelor of Arts in Economics",
-    "Bachelor of Science in Real Estate",
-    "Master of Business Administration (MBA)",
-    "Bachelor of Science in Finance",
-    "Associate Degree in Real Estate"
-]
+    SKILLS = (
+        "Real Estate", "Property Management", "Real Estate Investment", "Sales", "Negotiation",
+        "Market Analysis", "Client Relations", "Property Valuation", "Contract Negotiation",
+        "Residential Real Estate", "Commercial Real Estate", "Luxury Properties", "Foreclosures",
+        "Short Sales", "First Time Home Buyers", "Investment Properties", "Property Marketing",
+        "Real Estate Law", "Mortgage Lending", "Home Staging", "Real Estate Photography",
+        "Lead Generation", "Customer Service", "Communication", "Networking"
+    )
 
-FIELD_OF_STUDY = [
-    "Business Administration", "Real Estate", "Finance", "Economics", "Marketing",
-    "Business Management", "Accounting", "Entrepreneurship"
-]
+    SCHOOLS = (
+        "University of California, Berkeley", "New York University", "University of Southern California",
+        "University of Texas at Austin", "University of Miami", "Arizona State University",
+        "University of Washington", "Boston University", "University of Colorado Boulder",
+        "Florida State University", "Georgia State University", "Portland State University"
+    )
+
+    DEGREES = (
+        "Bachelor of Science in Business Administration",
+        "Bachelor of Arts in Economics",
+        "Bachelor of Science in Real Estate",
+        "Master of Business Administration (MBA)",
+        "Bachelor of Science in Finance",
+        "Associate Degree in Real Estate"
+    )
+
+    FIELD_OF_STUDY = (
+        "Business Administration", "Real Estate", "Finance", "Economics", "Marketing",
+        "Business Management", "Accounting", "Entrepreneurship"
+    )
+    return (
+        FIRST_NAMES,
+        LAST_NAMES,
+        REAL_ESTATE_COMPANIES,
+        CITY_PARTS,
+        JOB_TITLES,
+        SKILLS,
+        SCHOOLS,
+        DEGREES,
+        FIELD_OF_STUDY,
+    )
+
+
+def _load_pools():
+    use_cache = os.environ.get("LINKEDIN_MOCK_CACHE") == "1"
+    if use_cache:
+        try:
+            with open(_POOLS_CACHE, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
+    pools = _build_pools()
+    if use_cache:
+        try:
+            with open(_POOLS_CACHE, "wb") as f:
+                pickle.dump(pools, f, pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    return pools
+
+
+(FIRST_NAMES, LAST_NAMES, REAL_ESTATE_COMPANIES, CITY_PARTS, JOB_TITLES,
+ SKILLS, SCHOOLS, DEGREES, FIELD_OF_STUDY) = _load_pools()
+
+CITIES = tuple(f"{city}, {state}" for city, state in CITY_PARTS)
+
+
+_RNG = np.random.default_rng() if np is not None else None
+
+_THREAD_RNG = threading.local()
+
+
+def _thread_local_rng() -> random.Random:
+    """Per-thread random.Random, seeded independently on first use.
+
+    The module-level random functions all funnel through one shared
+    instance, so concurrent generation from threads serializes on its
+    state; a thread-local generator gives each worker its own stream
+    with no contention.
+    """
+    rng = getattr(_THREAD_RNG, "rng", None)
+    if rng is None:
+        rng = _THREAD_RNG.rng = random.Random()
+    return rng
+
+# Nominal scrape delay in seconds; 0 (or a negative value) disables the
+# simulated waits entirely, which collapses multi-profile runs to
+# sub-second for tests and benchmarks of downstream consumers
+DELAY = float(os.environ.get("LINKEDIN_MOCK_DELAY", "3"))
+
+# Profile/company/job blurb templates; _compile_tmpls below turns each
+# into a precompiled f-string lambda so only the chosen variant is ever
+# rendered, with no per-placeholder dict lookup at call time.
+ABOUT_TMPLS = (
+    "Experienced {jt_lower} specializing in {city} real estate market. "
+    "Committed to helping clients achieve their real estate goals with integrity and professionalism.",
+
+    "Licensed real estate professional with expertise in residential and commercial properties. "
+    "Passionate about connecting buyers and sellers in the {city} area.",
+
+    "Dedicated {jt_lower} with a proven track record of successful transactions. "
+    "Specializing in luxury properties and investment real estate in {city}.",
+
+    "Results-driven real estate agent helping clients navigate the {city} market. "
+    "Expert in property valuation, market analysis, and negotiation.",
+)
+
+EXPERIENCE_DESC_TMPLS = (
+    "Specialized in {segment} real estate transactions. "
+    "Managed client relationships and closed {deals}+ successful deals.",
+
+    "Focused on {focus}. "
+    "Achieved top sales performance and maintained excellent client satisfaction ratings.",
+
+    "Expert in {expertise}. "
+    "Successfully facilitated real estate transactions totaling over ${volume}M in sales volume.",
+)
+
+COMPANY_ABOUT_TMPLS = (
+    "{company} is a leading real estate brokerage serving the {city} area. "
+    "We specialize in residential and commercial real estate transactions, helping clients achieve their property goals.",
+
+    "With over {years} years of experience, {company} has established itself as "
+    "a trusted name in the {city} real estate market. Our team of experienced professionals "
+    "is dedicated to providing exceptional service.",
+
+    "{company} offers comprehensive real estate services including property sales, acquisitions, "
+    "and investment consulting. We serve clients throughout {city} with integrity and expertise.",
+)
+
+JOB_DESC_TMPLS = (
+    "We are seeking an experienced {jt_lower} to join our team. "
+    "The ideal candidate will have a strong background in real estate sales and excellent communication skills.",
+
+    "Join our dynamic real estate team as a {jt_lower}. "
+    "Responsibilities include client relations, property showings, and transaction management.",
+
+    "Opportunity for a {jt_lower} with proven sales track record. "
+    "Competitive commission structure and comprehensive training provided.",
+)
+
+def _compile_tmpls(tmpls, params):
+    """Compile each template into an f-string lambda taking `params`.
+
+    format_map still does a dict lookup per placeholder at call time;
+    compiling the template body as an f-string once at import moves the
+    substitution into precompiled bytecode with positional-arg access.
+    """
+    sig = ", ".join(params)
+    return tuple(
+        eval(compile(f"lambda {sig}: f{t!r}", "<tmpl>", "eval"))
+        for t in tmpls
+    )
+
+
+_ABOUT_FNS = _compile_tmpls(ABOUT_TMPLS, ("jt_lower", "city"))
+_EXPERIENCE_DESC_FNS = _compile_tmpls(
+    EXPERIENCE_DESC_TMPLS, ("segment", "focus", "expertise", "deals", "volume")
+)
+_COMPANY_ABOUT_FNS = _compile_tmpls(COMPANY_ABOUT_TMPLS, ("company", "city", "years"))
+_JOB_DESC_FNS = _compile_tmpls(JOB_DESC_TMPLS, ("jt_lower",))
+
+_SKILLS_LIST = list(SKILLS)
+
+# Company names paired with their URL slugs, computed once at import
+_COMPANY_WITH_SLUGS = tuple(
+    (c, c.lower().replace(" ", "-").replace("/", "-").replace("'", ""))
+    for c in REAL_ESTATE_COMPANIES
+)
+
+# Job-listing pools, built once: the per-call versions re-allocated the
+# company concatenation and the option lists on every search
+_JOB_TITLES = (
+    "Real Estate Agent", "Real Estate Broker", "Licensed Real Estate Sales Associate",
+    "Commercial Real Estate Broker", "Residential Real Estate Agent", "Real Estate Sales Manager",
+    "Luxury Real Estate Specialist", "Real Estate Investment Advisor", "Property Manager",
+    "Real Estate Marketing Specialist"
+)
+
+_JOB_COMPANIES = REAL_ESTATE_COMPANIES + (
+    "Real Estate Solutions Inc.", "Premier Properties Group", "Elite Realty Partners",
+    "Metro Real Estate Services", "Prime Property Advisors"
+)
+
+_EMPLOYMENT_TYPES = ("Full-time", "Part-time", "Contract", "Commission")
+_SENIORITY_LEVELS = ("Entry level", "Associate", "Mid-Senior level", "Executive")
+
+# Headline classification: one case-insensitive scan instead of three
+# substring checks over three .lower() copies
+_TITLE_RE = re.compile(r"(broker|agent|specialist)", re.IGNORECASE)
+_TITLE_MAP = {
+    "broker": "Real Estate Broker",
+    "agent": "Real Estate Agent",
+    "specialist": "Real Estate Specialist",
+}
+
+_EXPERIENCE_SEGMENTS = ("residential", "commercial", "luxury")
+_EXPERIENCE_FOCUSES = ("first-time homebuyers", "luxury properties", "investment properties")
+_EXPERIENCE_EXPERTISE = ("property valuation", "market analysis", "negotiation")
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, preferring orjson's C encoder.
+
+    Compact by default: the outputs are machine-consumed and indent=2
+    roughly triples the byte count for nested profiles.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def _mock_delay(base: float, delay: Optional[float] = None):
+    """Sleep base seconds scaled by the configured delay.
+
+    base is the legacy sleep for that site; the effective wait is
+    base * delay / 3 so --delay 3 reproduces historical timing. When the
+    delay is zero the helper still yields once to keep the event loop
+    cooperative.
+    """
+    if delay is None:
+        delay = DELAY
+    await asyncio.sleep(base * (delay / 3.0) if delay > 0 else 0)
+
+
+def _write_json(path, obj, pretty: bool = False):
+    """Write obj as JSON bytes through one large-buffered binary handle."""
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(_dumps(obj, pretty))
+
+
+def _generate_experiences(now_ord: int):
+    """Generate 2-4 work experience entries ending at now_ord, newest first.
+
+    Date arithmetic runs on integer ordinal days; datetime objects are
+    only materialized for the final strftime formatting, which saves a
+    dozen datetime/timedelta allocations per profile.
+    """
+    rng = _thread_local_rng()
+    _randrange = rng.randrange
+    num_experiences = rng.randint(2, 4)
+    experiences = []
+    current_ord = now_ord
+
+    for i in range(num_experiences):
+        if i == 0:
+            # Current position
+            start_ord = current_ord - rng.randint(365, 1825)  # 1-5 years ago
+            end_ord = None
+            duration = f"{(current_ord - start_ord) // 30} months"
+        else:
+            # Past positions
+            end_ord = current_ord - rng.randint(30, 365 * i)
+            start_ord = end_ord - rng.randint(365, 1825)
+            duration = f"{(end_ord - start_ord) // 30} months"
+            current_ord = start_ord
+
+        exp_company = REAL_ESTATE_COMPANIES[_randrange(len(REAL_ESTATE_COMPANIES))]
+        exp_title = JOB_TITLES[_randrange(len(JOB_TITLES))]
+        exp_location = CITIES[_randrange(len(CITIES))]
+
+        description = _EXPERIENCE_DESC_FNS[_randrange(3)](
+            _EXPERIENCE_SEGMENTS[_randrange(3)],
+            _EXPERIENCE_FOCUSES[_randrange(3)],
+            _EXPERIENCE_EXPERTISE[_randrange(3)],
+            rng.randint(20, 150),
+            rng.randint(5, 50),
+        )
+
+        experiences.append({
+            "title": exp_title,
+            "company": exp_company,
+            "location": exp_location,
+            "description": description,
+            "start_date": datetime.fromordinal(start_ord).strftime("%Y-%m"),
+            "end_date": datetime.fromordinal(end_ord).strftime("%Y-%m") if end_ord else None,
+            "duration": duration,
+        })
+
+    return experiences
+
+
+def _draw_skills(k: int):
+    """Draw k distinct skills via shuffle + slice.
+
+    random.sample builds a selection pool per call; with k routinely
+    above half the 25-skill pool, one in-place shuffle of a reused-size
+    list plus a slice is cheaper. The shuffled copy doubles as the
+    result buffer.
+    """
+    pool = _SKILLS_LIST.copy()
+    _thread_local_rng().shuffle(pool)
+    del pool[k:]
+    return pool
+
+
+def _generate_educations():
+    """Generate 1-2 education entries."""
+    rng = _thread_local_rng()
+    num_educations = rng.randint(1, 2)
+    educations = []
+
+    _randrange = rng.randrange
+
+    for i in range(num_educations):
+        school = SCHOOLS[_randrange(len(SCHOOLS))]
+        degree = DEGREES[_randrange(len(DEGREES))]
+        field = FIELD_OF_STUDY[_randrange(len(FIELD_OF_STUDY))]
+
+        grad_year = rng.randint(1995, 2020)
+        start_year = grad_year - rng.randint(3, 5)
+
+        educations.append({
+            "school": school,
+            "degree": degree,
+            "field_of_study": field,
+            "start_date": f"{start_year}",
+            "end_date": f"{grad_year}",
+        })
+
+    return educations
 
 
 def generate_real_estate_broker_profile(profile_url: str = None, seed_data: dict = None):
     """Generate a realistic real estate broker profile"""
+    # Index the pools via a locally-bound randrange on the thread-local
+    # generator: random.choice pays a type check plus an attribute lookup
+    # per draw, which adds up over the ~30 draws a profile makes
+    rng = _thread_local_rng()
+    _randrange = rng.randrange
+
     # Use seed data if provided, otherwise generate random
     if seed_data:
         name = seed_data.get("name", "")
         headline = seed_data.get("headline", "")
-        location = seed_data.get("location", random.choice(CITIES))
-        company = seed_data.get("company", random.choice(REAL_ESTATE_COMPANIES))
+        location = seed_data.get("location") or CITIES[_randrange(len(CITIES))]
+        company = seed_data.get("company") or REAL_ESTATE_COMPANIES[_randrange(len(REAL_ESTATE_COMPANIES))]
         
         # Extract first and last name if possible
         name_parts = name.split()
@@ -139,117 +479,51 @@ def generate_real_estate_broker_profile(profile_url: str = None, seed_data: dict
             first_name = name_parts[0]
             last_name = name_parts[-1]
         else:
-            first_name = name_parts[0] if name_parts else random.choice(FIRST_NAMES)
-            last_name = random.choice(LAST_NAMES)
+            first_name = name_parts[0] if name_parts else FIRST_NAMES[_randrange(len(FIRST_NAMES))]
+            last_name = LAST_NAMES[_randrange(len(LAST_NAMES))]
         
         # Extract job title from headline if possible
-        job_title = random.choice(JOB_TITLES)  # Default fallback
-        if "broker" in headline.lower():
-            job_title = "Real Estate Broker"
-        elif "agent" in headline.lower():
-            job_title = "Real Estate Agent"
-        elif "specialist" in headline.lower():
-            job_title = "Real Estate Specialist"
+        m = _TITLE_RE.search(headline)
+        if m:
+            job_title = _TITLE_MAP[m.group(1).lower()]
+        else:
+            job_title = JOB_TITLES[_randrange(len(JOB_TITLES))]  # Default fallback
     else:
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
+        first_name = FIRST_NAMES[_randrange(len(FIRST_NAMES))]
+        last_name = LAST_NAMES[_randrange(len(LAST_NAMES))]
         name = f"{first_name} {last_name}"
         
-        company = random.choice(REAL_ESTATE_COMPANIES)
-        job_title = random.choice(JOB_TITLES)
-        location = random.choice(CITIES)
+        company = REAL_ESTATE_COMPANIES[_randrange(len(REAL_ESTATE_COMPANIES))]
+        job_title = JOB_TITLES[_randrange(len(JOB_TITLES))]
+        city_i = _randrange(len(CITY_PARTS))
+        location = CITIES[city_i]
+        city_name = CITY_PARTS[city_i][0]
         
         headline = f"{job_title} at {company}"
     
-    # Generate about section
-    city_name = location.split(',')[0] if ',' in location else location
-    about_templates = [
-        f"Experienced {job_title.lower()} specializing in {city_name} real estate market. "
-        f"Committed to helping clients achieve their real estate goals with integrity and professionalism.",
-        
-        f"Licensed real estate professional with expertise in residential and commercial properties. "
-        f"Passionate about connecting buyers and sellers in the {city_name} area.",
-        
-        f"Dedicated {job_title.lower()} with a proven track record of successful transactions. "
-        f"Specializing in luxury properties and investment real estate in {city_name}.",
-        
-        f"Results-driven real estate agent helping clients navigate the {city_name} market. "
-        f"Expert in property valuation, market analysis, and negotiation.",
-    ]
-    about = random.choice(about_templates)
+    # Generate about section (seeded locations are free-form, so split there)
+    if seed_data:
+        city_name = location.split(',')[0] if ',' in location else location
+    about = _ABOUT_FNS[_randrange(len(_ABOUT_FNS))](job_title.lower(), city_name)
     
+    # One clock read per profile; the ordinal feeds the experience dates
+    # and the isoformat string is reused for scraped_at
+    now = datetime.now()
+
     # Generate work experience (2-4 positions)
-    num_experiences = random.randint(2, 4)
-    experiences = []
-    current_date = datetime.now()
-    
-    for i in range(num_experiences):
-        if i == 0:
-            # Current position
-            start_date = current_date - timedelta(days=random.randint(365, 1825))  # 1-5 years ago
-            end_date = None
-            duration = f"{(current_date - start_date).days // 30} months"
-        else:
-            # Past positions
-            end_date = current_date - timedelta(days=random.randint(30, 365 * i))
-            start_date = end_date - timedelta(days=random.randint(365, 1825))
-            duration = f"{(end_date - start_date).days // 30} months"
-            current_date = start_date
-        
-        exp_company = random.choice(REAL_ESTATE_COMPANIES) if i == 0 else random.choice(REAL_ESTATE_COMPANIES)
-        exp_title = random.choice(JOB_TITLES)
-        exp_location = random.choice(CITIES)
-        
-        description_templates = [
-            f"Specialized in {random.choice(['residential', 'commercial', 'luxury'])} real estate transactions. "
-            f"Managed client relationships and closed {random.randint(20, 150)}+ successful deals.",
-            
-            f"Focused on {random.choice(['first-time homebuyers', 'luxury properties', 'investment properties'])}. "
-            f"Achieved top sales performance and maintained excellent client satisfaction ratings.",
-            
-            f"Expert in {random.choice(['property valuation', 'market analysis', 'negotiation'])}. "
-            f"Successfully facilitated real estate transactions totaling over ${random.randint(5, 50)}M in sales volume.",
-        ]
-        
-        experiences.append({
-            "title": exp_title,
-            "company": exp_company,
-            "location": exp_location,
-            "description": random.choice(description_templates),
-            "start_date": start_date.strftime("%Y-%m"),
-            "end_date": end_date.strftime("%Y-%m") if end_date else None,
-            "duration": duration,
-        })
-    
+    experiences = _generate_experiences(now.toordinal())
+
     # Generate education (1-2 entries)
-    num_educations = random.randint(1, 2)
-    educations = []
-    
-    for i in range(num_educations):
-        school = random.choice(SCHOOLS)
-        degree = random.choice(DEGREES)
-        field = random.choice(FIELD_OF_STUDY)
-        
-        grad_year = random.randint(1995, 2020)
-        start_year = grad_year - random.randint(3, 5)
-        
-        educations.append({
-            "school": school,
-            "degree": degree,
-            "field_of_study": field,
-            "start_date": f"{start_year}",
-            "end_date": f"{grad_year}",
-        })
-    
+    educations = _generate_educations()
+
     # Generate skills (8-15 skills)
-    num_skills = random.randint(8, 15)
-    selected_skills = random.sample(SKILLS, num_skills)
+    selected_skills = _draw_skills(rng.randint(8, 15))
     
     # Generate LinkedIn URL
     if profile_url:
         linkedin_url = profile_url
     else:
-        username = f"{first_name.lower()}-{last_name.lower()}-{random.randint(100, 999)}"
+        username = f"{first_name.lower()}-{last_name.lower()}-{rng.randint(100, 999)}"
         linkedin_url = f"https://linkedin.com/in/{username}/"
     
     return {
@@ -261,14 +535,123 @@ def generate_real_estate_broker_profile(profile_url: str = None, seed_data: dict
         "experiences": experiences,
         "educations": educations,
         "skills": selected_skills,
-        "scraped_at": datetime.now().isoformat(),
+        "scraped_at": now.isoformat(),
     }
 
 
+def generate_real_estate_broker_profiles_batch(n: int):
+    """Generate n random broker profiles in one batch.
+
+    With numpy installed, the headline attribute indices for the whole
+    batch come from a handful of vectorized Generator calls rather than
+    per-profile random.choice dispatch; the nested sections reuse the
+    scalar helpers. Without numpy this degrades to n scalar calls.
+    """
+    if _RNG is None:
+        return [generate_real_estate_broker_profile() for _ in range(n)]
+
+    first_idx = _RNG.integers(0, len(FIRST_NAMES), size=n)
+    last_idx = _RNG.integers(0, len(LAST_NAMES), size=n)
+    company_idx = _RNG.integers(0, len(REAL_ESTATE_COMPANIES), size=n)
+    title_idx = _RNG.integers(0, len(JOB_TITLES), size=n)
+    city_idx = _RNG.integers(0, len(CITIES), size=n)
+    url_suffix = _RNG.integers(100, 1000, size=n)
+    about_idx = _RNG.integers(0, len(ABOUT_TMPLS), size=n)
+    # One permutation matrix covers every profile's skills draw: row i
+    # shuffled independently, sliced to that profile's skill count
+    skills_k = _RNG.integers(8, 16, size=n)
+    skills_perm = _RNG.permuted(
+        np.broadcast_to(np.arange(len(SKILLS)), (n, len(SKILLS))), axis=1
+    )
+
+    now = datetime.now()
+    now_ord = now.toordinal()
+    now_iso = now.isoformat()
+
+    profiles = []
+    for i in range(n):
+        first_name = FIRST_NAMES[first_idx[i]]
+        last_name = LAST_NAMES[last_idx[i]]
+        company = REAL_ESTATE_COMPANIES[company_idx[i]]
+        job_title = JOB_TITLES[title_idx[i]]
+        location = CITIES[city_idx[i]]
+
+        city_name = CITY_PARTS[city_idx[i]][0]
+
+        username = f"{first_name.lower()}-{last_name.lower()}-{url_suffix[i]}"
+
+        profiles.append({
+            "name": f"{first_name} {last_name}",
+            "headline": f"{job_title} at {company}",
+            "location": location,
+            "about": _ABOUT_FNS[about_idx[i]](job_title.lower(), city_name),
+            "linkedin_url": f"https://linkedin.com/in/{username}/",
+            "experiences": _generate_experiences(now_ord),
+            "educations": _generate_educations(),
+            "skills": [SKILLS[j] for j in skills_perm[i, :skills_k[i]]],
+            "scraped_at": now_iso,
+        })
+
+    return profiles
+
+
+_WORKER_RNG_SEEDED = False
+
+
+def _seed_worker_rng():
+    """Reseed this process's RNGs on first use inside a pool worker.
+
+    Forked workers inherit the parent's RNG state, so without this every
+    worker would generate the same profiles. Seeded lazily at module
+    scope rather than per chunk so repeated chunks in one worker stay
+    independent.
+    """
+    global _RNG, _WORKER_RNG_SEEDED
+    if _WORKER_RNG_SEEDED:
+        return
+    seed = os.getpid() ^ time_ns()
+    random.seed(seed)
+    _THREAD_RNG.rng = random.Random(seed ^ 1)
+    if np is not None:
+        _RNG = np.random.default_rng(seed)
+    _WORKER_RNG_SEEDED = True
+
+
+def _gen_chunk(k: int):
+    _seed_worker_rng()
+    return generate_real_estate_broker_profiles_batch(k)
+
+
+def _split(n: int, parts: int):
+    """Split n items into up to `parts` near-equal non-empty chunk sizes."""
+    base, extra = divmod(n, parts)
+    return [base + (i < extra) for i in range(parts) if base + (i < extra)]
+
+
+def generate_batch(n: int, workers: int = None):
+    """Generate n broker profiles across a process pool.
+
+    Profile synthesis is CPU-bound and each profile is independent, so
+    chunks scale across cores without the GIL. Small batches skip the
+    pool: process startup costs more than it saves.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or n < workers * 4:
+        return generate_real_estate_broker_profiles_batch(n)
+    profiles = []
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for chunk in ex.map(_gen_chunk, _split(n, workers)):
+            profiles.extend(chunk)
+    return profiles
+
+
 def generate_real_estate_company(company_url: str = None):
     """Generate a realistic real estate company profile"""
-    company_name = random.choice(REAL_ESTATE_COMPANIES)
-    location = random.choice(CITIES)
+    now = datetime.now()
+    rng = _thread_local_rng()
+    company_name, company_slug = rng.choice(_COMPANY_WITH_SLUGS)
+    city_i = rng.randrange(len(CITY_PARTS))
+    location = CITIES[city_i]
     
     company_sizes = ["11-50 employees", "51-200 employees", "201-500 employees", "501-1000 employees", "1001-5000 employees"]
     industries = ["Real Estate", "Real Estate Services", "Property Management", "Real Estate Development"]
@@ -279,84 +662,51 @@ def generate_real_estate_company(company_url: str = None):
         "Property Management", "Real Estate Investment", "Property Development"
     ]
     
-    about_templates = [
-        f"{company_name} is a leading real estate brokerage serving the {location.split(',')[0]} area. "
-        f"We specialize in residential and commercial real estate transactions, helping clients achieve their property goals.",
-        
-        f"With over {random.randint(20, 50)} years of experience, {company_name} has established itself as "
-        f"a trusted name in the {location.split(',')[0]} real estate market. Our team of experienced professionals "
-        f"is dedicated to providing exceptional service.",
-        
-        f"{company_name} offers comprehensive real estate services including property sales, acquisitions, "
-        f"and investment consulting. We serve clients throughout {location.split(',')[0]} with integrity and expertise.",
-    ]
+    about = rng.choice(_COMPANY_ABOUT_FNS)(
+        company_name, CITY_PARTS[city_i][0], rng.randint(20, 50)
+    )
     
     if company_url:
         linkedin_url = company_url
     else:
-        company_slug = company_name.lower().replace(" ", "-").replace("/", "-").replace("'", "")
         linkedin_url = f"https://linkedin.com/company/{company_slug}/"
     
     return {
         "name": company_name,
-        "industry": random.choice(industries),
-        "company_size": random.choice(company_sizes),
+        "industry": rng.choice(industries),
+        "company_size": rng.choice(company_sizes),
         "headquarters": location,
-        "founded": str(random.choice(founded_years)),
-        "specialties": random.sample(specialties, random.randint(2, 4)),
-        "about": random.choice(about_templates),
+        "founded": str(rng.choice(founded_years)),
+        "specialties": rng.sample(specialties, rng.randint(2, 4)),
+        "about": about,
         "linkedin_url": linkedin_url,
-        "scraped_at": datetime.now().isoformat(),
+        "scraped_at": now.isoformat(),
     }
 
 
 def generate_real_estate_jobs(keywords: str, location: Optional[str] = None, limit: int = 10):
     """Generate realistic real estate job listings"""
+    rng = _thread_local_rng()
     jobs = []
     
-    job_titles = [
-        "Real Estate Agent", "Real Estate Broker", "Licensed Real Estate Sales Associate",
-        "Commercial Real Estate Broker", "Residential Real Estate Agent", "Real Estate Sales Manager",
-        "Luxury Real Estate Specialist", "Real Estate Investment Advisor", "Property Manager",
-        "Real Estate Marketing Specialist"
-    ]
-    
-    companies = REAL_ESTATE_COMPANIES + [
-        "Real Estate Solutions Inc.", "Premier Properties Group", "Elite Realty Partners",
-        "Metro Real Estate Services", "Prime Property Advisors"
-    ]
-    
-    locations = CITIES if not location else [location] + CITIES[:5]
-    
-    employment_types = ["Full-time", "Part-time", "Contract", "Commission"]
-    seniority_levels = ["Entry level", "Associate", "Mid-Senior level", "Executive"]
+    locations = (location, *CITIES[:5]) if location else CITIES
     
     for i in range(min(limit, 15)):
-        job_title = random.choice(job_titles)
-        company = random.choice(companies)
-        job_location = random.choice(locations)
+        job_title = rng.choice(_JOB_TITLES)
+        company = rng.choice(_JOB_COMPANIES)
+        job_location = rng.choice(locations)
         
-        description_templates = [
-            f"We are seeking an experienced {job_title.lower()} to join our team. "
-            f"The ideal candidate will have a strong background in real estate sales and excellent communication skills.",
-            
-            f"Join our dynamic real estate team as a {job_title.lower()}. "
-            f"Responsibilities include client relations, property showings, and transaction management.",
-            
-            f"Opportunity for a {job_title.lower()} with proven sales track record. "
-            f"Competitive commission structure and comprehensive training provided.",
-        ]
         
-        username = f"job-{random.randint(100000, 999999)}"
+        username = f"job-{rng.randint(100000, 999999)}"
         linkedin_url = f"https://linkedin.com/jobs/view/{username}/"
         
         jobs.append({
             "title": job_title,
             "company": company,
             "location": job_location,
-            "description": random.choice(description_templates),
-            "employment_type": random.choice(employment_types),
-            "seniority_level": random.choice(seniority_levels),
+            "description": rng.choice(_JOB_DESC_FNS)(job_title.lower()),
+            "employment_type": rng.choice(_EMPLOYMENT_TYPES),
+            "seniority_level": rng.choice(_SENIORITY_LEVELS),
             "linkedin_url": linkedin_url,
         })
     
@@ -367,27 +717,26 @@ async def mock_scrape_person(
     profile_url: str,
     output_file: Optional[str] = None,
     seed_data: dict = None,
+    delay: Optional[float] = None,
 ):
     """Mock scrape a LinkedIn person profile (real estate broker)"""
     print(f"[*] Scraping person profile: {profile_url}")
     
     # Simulate loading session
-    await asyncio.sleep(0.5)
+    await _mock_delay(0.5, delay)
     print(f"[OK] Loaded session from linkedin_session.json")
     
     # Simulate scraping delay
-    await asyncio.sleep(random.uniform(2, 4))
+    await _mock_delay(random.uniform(2, 4), delay)
     
     # Generate profile data
     person_data = generate_real_estate_broker_profile(profile_url, seed_data)
     
     # Save to file
     if not output_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"linkedin_person_{timestamp}.json"
+        output_file = f"linkedin_person_{datetime.now():%Y%m%d_%H%M%S}.json"
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(person_data, f, indent=2, ensure_ascii=False)
+    _write_json(output_file, person_data)
     
     print(f"[OK] Profile data saved to {output_file}")
     print(f"[*] Name: {person_data['name']}")
@@ -403,46 +752,84 @@ async def mock_scrape_person(
 async def mock_scrape_multiple_profiles(
     profile_urls: List[str],
     output_file: Optional[str] = None,
+    concurrency: int = 5,
+    delay: Optional[float] = None,
+    output_format: str = "json",
 ):
-    """Mock scrape multiple LinkedIn person profiles (real estate brokers)"""
+    """Mock scrape multiple LinkedIn person profiles (real estate brokers)
+
+    With output_format="ndjson" each profile streams to disk as one JSON
+    line the moment it finishes, after a metadata header line, so memory
+    stays flat no matter how many URLs are scraped and consumers can
+    tail the file while the run is in flight.
+    """
     print(f"[*] Scraping {len(profile_urls)} person profiles...")
-    
+
     # Simulate loading session
-    await asyncio.sleep(0.5)
+    await _mock_delay(0.5, delay)
     print(f"[OK] Loaded session from linkedin_session.json")
-    
-    all_profiles = []
-    
-    for i, profile_url in enumerate(profile_urls, 1):
-        print(f"[*] Scraping profile {i}/{len(profile_urls)}: {profile_url}")
-        
-        # Use seed data if available (cycle through seeds)
-        seed_data = None
-        if i <= len(REAL_ESTATE_BROKER_SEEDS):
-            seed_data = REAL_ESTATE_BROKER_SEEDS[i - 1]
-        
-        # Simulate scraping delay
-        await asyncio.sleep(random.uniform(2, 4))
-        
-        # Generate profile data
-        person_data = generate_real_estate_broker_profile(profile_url, seed_data)
-        all_profiles.append(person_data)
-        
-        print(f"[OK] Scraped: {person_data['name']} - {person_data['headline']}")
-    
-    # Save all profiles to file
+
+    ndjson = output_format == "ndjson"
+    out_f = None
+    if ndjson:
+        if not output_file:
+            output_file = f"linkedin_profiles_{datetime.now():%Y%m%d_%H%M%S}.ndjson"
+        out_f = open(output_file, "wb", buffering=1 << 20)
+        out_f.write(_dumps({
+            "total_profiles": len(profile_urls),
+            "scraped_at": datetime.now().isoformat(),
+        }) + b"\n")
+
+    # Each profile is independent, so scrape them concurrently: total wall
+    # time becomes the max of the simulated delays instead of their sum.
+    # The semaphore caps simultaneous "scrapes" like a real worker pool would.
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _scrape_one(i: int, profile_url: str):
+        async with semaphore:
+            print(f"[*] Scraping profile {i}/{len(profile_urls)}: {profile_url}")
+
+            # Use seed data if available (cycle through seeds)
+            seed_data = None
+            if i <= len(REAL_ESTATE_BROKER_SEEDS):
+                seed_data = REAL_ESTATE_BROKER_SEEDS[i - 1]
+
+            # Simulate scraping delay
+            await _mock_delay(random.uniform(2, 4), delay)
+
+            # Generate profile data
+            person_data = generate_real_estate_broker_profile(profile_url, seed_data)
+
+            print(f"[OK] Scraped: {person_data['name']} - {person_data['headline']}")
+            if out_f is not None:
+                # Event-loop writes are serialized, no lock needed
+                out_f.write(_dumps(person_data) + b"\n")
+                return None
+            return person_data
+
+    all_profiles = list(await asyncio.gather(
+        *(_scrape_one(i, url) for i, url in enumerate(profile_urls, 1))
+    ))
+
+    if ndjson:
+        out_f.close()
+        print(f"[OK] All profiles saved to {output_file}")
+        print(f"[*] Total profiles scraped: {len(profile_urls)}")
+        return {"total_profiles": len(profile_urls), "output_file": output_file}
+
+    # Save all profiles to file; one clock read covers the default file
+    # name and the scraped_at stamp
+    now = datetime.now()
     if not output_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"linkedin_profiles_{timestamp}.json"
+        output_file = f"linkedin_profiles_{now:%Y%m%d_%H%M%S}.json"
     
     result = {
         "total_profiles": len(all_profiles),
         "profiles": all_profiles,
-        "scraped_at": datetime.now().isoformat(),
+        "scraped_at": now.isoformat(),
     }
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    _write_json(output_file, result)
     
     print(f"[OK] All profiles saved to {output_file}")
     print(f"[*] Total profiles scraped: {len(all_profiles)}")
@@ -453,27 +840,26 @@ async def mock_scrape_multiple_profiles(
 async def mock_scrape_company(
     company_url: str,
     output_file: Optional[str] = None,
+    delay: Optional[float] = None,
 ):
     """Mock scrape a LinkedIn company page (real estate company)"""
     print(f"[*] Scraping company: {company_url}")
     
     # Simulate loading session
-    await asyncio.sleep(0.5)
+    await _mock_delay(0.5, delay)
     print(f"[OK] Loaded session from linkedin_session.json")
     
     # Simulate scraping delay
-    await asyncio.sleep(random.uniform(2, 4))
+    await _mock_delay(random.uniform(2, 4), delay)
     
     # Generate company data
     company_data = generate_real_estate_company(company_url)
     
     # Save to file
     if not output_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"linkedin_company_{timestamp}.json"
+        output_file = f"linkedin_company_{datetime.now():%Y%m%d_%H%M%S}.json"
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(company_data, f, indent=2, ensure_ascii=False)
+    _write_json(output_file, company_data)
     
     print(f"[OK] Company data saved to {output_file}")
     print(f"[*] Company: {company_data['name']}")
@@ -487,35 +873,35 @@ async def mock_search_jobs(
     location: Optional[str] = None,
     limit: int = 10,
     output_file: Optional[str] = None,
+    delay: Optional[float] = None,
 ):
     """Mock search for LinkedIn jobs (real estate jobs)"""
     print(f"[*] Searching jobs: keywords='{keywords}', location='{location}', limit={limit}")
     
     # Simulate loading session
-    await asyncio.sleep(0.5)
+    await _mock_delay(0.5, delay)
     print(f"[OK] Loaded session from linkedin_session.json")
     
     # Simulate search delay
-    await asyncio.sleep(random.uniform(2, 4))
+    await _mock_delay(random.uniform(2, 4), delay)
     
     # Generate job data
     jobs_data = generate_real_estate_jobs(keywords, location, limit)
     
+    now = datetime.now()
     result = {
         "keywords": keywords,
         "location": location,
         "total_results": len(jobs_data),
         "jobs": jobs_data,
-        "scraped_at": datetime.now().isoformat(),
+        "scraped_at": now.isoformat(),
     }
     
     # Save to file
     if not output_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"linkedin_jobs_{timestamp}.json"
+        output_file = f"linkedin_jobs_{now:%Y%m%d_%H%M%S}.json"
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    _write_json(output_file, result)
     
     print(f"[OK] Job search results saved to {output_file}")
     print(f"[*] Found {len(jobs_data)} jobs")
@@ -534,6 +920,10 @@ def main():
     parser.add_argument("--session", default="linkedin_session.json", help="Session file path (ignored in mock)")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode (ignored in mock)")
     parser.add_argument("--no-headless", dest="headless", action="store_false", help="Show browser window (ignored in mock)")
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json",
+                       help="Output format for multiple mode (ndjson streams one profile per line)")
+    parser.add_argument("--delay", type=float, default=None,
+                       help="Simulated delay scale in seconds (0 disables; default: $LINKEDIN_MOCK_DELAY or 3)")
     
     args = parser.parse_args()
     
@@ -541,23 +931,24 @@ def main():
         if not args.url:
             print("[X] Error: --url is required for person mode")
             sys.exit(1)
-        asyncio.run(mock_scrape_person(args.url, args.output))
+        asyncio.run(mock_scrape_person(args.url, args.output, delay=args.delay))
     elif args.mode == "multiple":
         if not args.urls:
             print("[X] Error: --urls is required for multiple mode")
             sys.exit(1)
         urls = [url.strip() for url in args.urls.split(",")]
-        asyncio.run(mock_scrape_multiple_profiles(urls, args.output))
+        asyncio.run(mock_scrape_multiple_profiles(
+            urls, args.output, delay=args.delay, output_format=args.format))
     elif args.mode == "company":
         if not args.url:
             print("[X] Error: --url is required for company mode")
             sys.exit(1)
-        asyncio.run(mock_scrape_company(args.url, args.output))
+        asyncio.run(mock_scrape_company(args.url, args.output, delay=args.delay))
     elif args.mode == "jobs":
         if not args.keywords:
             print("[X] Error: --keywords is required for jobs mode")
             sys.exit(1)
-        asyncio.run(mock_search_jobs(args.keywords, args.location, args.limit, args.output))
+        asyncio.run(mock_search_jobs(args.keywords, args.location, args.limit, args.output, delay=args.delay))
 
 
 if __name__ == "__main__":
@@ -10,29 +10,235 @@ import json
 import sys
 import argparse
 from pathlib import Path
+from urllib.parse import urlsplit
 from datetime import datetime
 from typing import Optional, List
-import subprocess
+from operator import attrgetter
+import random
+import re
+import functools
+import logging
+import os
 
+# orjson encodes/decodes in C, several times faster than stdlib json on
+# the nested profile dicts; fall back silently when not installed
 try:
-    from linkedin_scraper import (
-        BrowserManager,
-        PersonScraper,
-        CompanyScraper,
-        JobSearchScraper,
-        wait_for_manual_login,
-        login_with_credentials,
+    import orjson
+except ImportError:
+    orjson = None
+
+# Status output goes through a module logger with lazy %-formatting, so
+# arguments are never rendered when the level filters the record out
+log = logging.getLogger("linkedin_scraper.wrapper")
+
+
+class _JsonLogFormatter(logging.Formatter):
+    """Emit one JSON object per log line for machine consumption."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.now().isoformat(),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        if orjson is not None:
+            return orjson.dumps(entry).decode("utf-8")
+        return json.dumps(entry, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_scrapers() -> None:
+    """Import the Playwright-backed scraper stack on first browser use.
+
+    Importing linkedin_scraper (and with it Playwright) at module load
+    made every invocation pay the full import cost up front, including
+    --mock and --use-daemon runs that never open a browser locally. The
+    names are injected into module globals so the scrape functions read
+    exactly as before; lru_cache makes repeat calls free.
+    """
+    try:
+        import linkedin_scraper as _ls
+        from playwright.async_api import TimeoutError as _TimeoutError
+    except ImportError as e:
+        log.error("Error: Missing required package: %s", e)
+        log.warning("Please install dependencies: cd submodules/linkedin-scraper && ./setup-venv.sh")
+        sys.exit(1)
+    globals().update(
+        BrowserManager=_ls.BrowserManager,
+        PersonScraper=_ls.PersonScraper,
+        CompanyScraper=_ls.CompanyScraper,
+        JobSearchScraper=_ls.JobSearchScraper,
+        wait_for_manual_login=_ls.wait_for_manual_login,
+        login_with_credentials=_ls.login_with_credentials,
+        PlaywrightTimeoutError=_TimeoutError,
     )
-except ImportError as e:
-    print(f"[X] Error: Missing required package: {e}")
-    print("[!] Please install dependencies: cd submodules/linkedin-scraper && ./setup-venv.sh")
-    sys.exit(1)
 
-# Import cookie extraction if available
+# Resource types and beacon hosts no scraper needs; aborting them cuts a
+# large share of bytes and speeds DOMContentLoaded. Stylesheets stay
+# enabled because selector visibility checks depend on layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_URL_PARTS = ("px.ads.linkedin", "licdn.com/scds")
+
+
+async def _block_heavy_requests(context) -> None:
+    """Install a route that aborts images, fonts, media and ad beacons."""
+    async def _router(route):
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+            part in request.url for part in _BLOCKED_URL_PARTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    await context.route("**/*", _router)
+
+
+# Cookie names that indicate an authenticated LinkedIn session
+# A malformed URL costs a full 30s page.goto timeout in the browser;
+# rejecting it up front with a compiled regex costs microseconds
+_LI_URL_RE = re.compile(r"^https://(www\.)?linkedin\.com/(in|company)/[A-Za-z0-9%_\-\.]+/?$")
+
+
+def _validate_urls(urls: List[str]) -> List[str]:
+    """Drop URLs that cannot be LinkedIn profile/company pages."""
+    valid = [u for u in urls if _LI_URL_RE.match(u)]
+    for bad in urls:
+        if not _LI_URL_RE.match(bad):
+            log.warning("Skipping malformed LinkedIn URL: %s", bad)
+    return valid
+
+
+def _dedupe_urls(urls: List[str]) -> List[str]:
+    """Drop URLs that normalize to an already-seen target.
+
+    Uses the cache layer's normalization (lowercased host, no query or
+    trailing slash), so two spellings of one profile cost one scrape.
+    """
+    seen = set()
+    unique = []
+    for url in urls:
+        key = normalize_url(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    if len(unique) < len(urls):
+        log.info("Dropped %s duplicate URL(s)", len(urls) - len(unique))
+    return unique
+
+
+_AUTH_COOKIE_NAMES = frozenset({'li_at', 'JSESSIONID', 'bcookie', 'bscookie'})
+
+
+def _to_pw(cookie: dict) -> dict:
+    """Map an extracted cookie dict to Playwright's cookie shape."""
+    return {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'domain': cookie.get('domain', '.linkedin.com'),
+        'path': cookie.get('path', '/'),
+        **({'expires': cookie['expiry']} if cookie.get('expiry') else {}),
+        **({'secure': cookie['secure']} if cookie.get('secure') else {}),
+        **({'httpOnly': cookie['httpOnly']} if cookie.get('httpOnly') else {}),
+    }
+
+
+def _dumps_line(obj) -> bytes:
+    """Serialize obj to one compact JSON line (no trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_json(obj) -> bytes:
+    """Serialize obj to indented JSON bytes, preferring orjson's C encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+async def _load_json_async(path: str):
+    """Load a JSON file without blocking the event loop."""
+    raw = await asyncio.to_thread(Path(path).read_bytes)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+async def _dump_json_async(path: str, obj) -> None:
+    """Write obj as indented JSON without blocking the event loop."""
+    await asyncio.to_thread(Path(path).write_bytes, _dumps_json(obj))
+
+
+async def _write_files(queue: asyncio.Queue) -> None:
+    """Drain (path, payload) pairs from queue, writing each off the loop.
+
+    Runs as a background task so the scrape loop can hand off a finished
+    result and start the next network-bound scrape while the previous
+    write is still hitting the disk.
+    """
+    while True:
+        path, payload = await queue.get()
+        try:
+            await asyncio.to_thread(Path(path).write_bytes, payload)
+            log.info("Saved to %s", path)
+        except OSError as e:
+            log.error("Error writing %s: %s", path, e)
+        finally:
+            queue.task_done()
+
+
+async def _with_retry(coro_factory, attempts: int = 3, base: float = 1.5):
+    """Await coro_factory(), retrying transient timeouts with backoff.
+
+    Sleeps base * 2**i plus up to a second of jitter between attempts so
+    parallel tasks do not all retry in lockstep. Non-timeout errors and
+    the final timeout propagate to the caller.
+    """
+    for i in range(attempts - 1):
+        try:
+            return await coro_factory()
+        except (PlaywrightTimeoutError, asyncio.TimeoutError) as e:
+            delay = base * (2 ** i) + random.random()
+            log.warning("Transient error (%s); retrying in %.1fs", e, delay)
+            await asyncio.sleep(delay)
+    return await coro_factory()
+
+
+# Browserless HTTP fast path (optional, needs httpx): lets us probe the
+# saved session with one GET before paying for a Chromium launch
 try:
-    from extract_linkedin_cookies import extract_linkedin_cookies
+    import scraper_http
 except ImportError:
-    extract_linkedin_cookies = None
+    scraper_http = None
+
+# On-disk URL cache: a repeat scrape of the same profile within the TTL
+# skips the browser entirely
+# Session probes are remembered for the life of the process: one cheap
+# GET against the feed endpoint answers "is this session still valid?"
+# for every scrape in a batch, instead of one extra LinkedIn-visible
+# request per profile
+_PROBED_SESSIONS: dict = {}
+
+
+async def _session_alive(session_file: str) -> Optional[bool]:
+    """Probe session validity over HTTP, at most once per session file."""
+    if scraper_http is None or scraper_http.httpx is None:
+        return None
+    if session_file not in _PROBED_SESSIONS:
+        if not await asyncio.to_thread(Path(session_file).exists):
+            return None
+        _PROBED_SESSIONS[session_file] = await scraper_http.probe_session(session_file)
+    return _PROBED_SESSIONS[session_file]
+
+
+try:
+    from cache import cache_get, cache_put, normalize_url, DEFAULT_TTL as CACHE_TTL
+except ImportError:
+    cache_get = cache_put = None
+    CACHE_TTL = 86400
+
+    def normalize_url(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme or 'https'}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
 
 
 async def create_session_from_cookies(
@@ -41,80 +247,60 @@ async def create_session_from_cookies(
     headless: bool = True,
 ):
     """Create a LinkedIn session from extracted cookies"""
-    print(f"[*] Creating LinkedIn session from cookies: {cookie_file}")
+    _load_scrapers()
+    log.info("Creating LinkedIn session from cookies: %s", cookie_file)
     
-    if not Path(cookie_file).exists():
-        print(f"[X] Error: Cookie file not found: {cookie_file}")
+    if not await asyncio.to_thread(Path(cookie_file).exists):
+        log.error("Error: Cookie file not found: %s", cookie_file)
         return False
     
     # Load cookies from JSON file
     try:
-        with open(cookie_file, 'r', encoding='utf-8') as f:
-            cookies = json.load(f)
-        print(f"[OK] Loaded {len(cookies)} cookie(s) from {cookie_file}")
+        cookies = await _load_json_async(cookie_file)
+        log.info("Loaded %s cookie(s) from %s", len(cookies), cookie_file)
     except Exception as e:
-        print(f"[X] Error loading cookies: {e}")
+        log.error("Error loading cookies: %s", e)
         return False
     
     # Check for authentication cookies
-    auth_cookie_names = ['li_at', 'JSESSIONID', 'bcookie', 'bscookie']
-    found_auth = any(c.get('name') in auth_cookie_names for c in cookies)
+    found_auth = not _AUTH_COOKIE_NAMES.isdisjoint(c.get('name') for c in cookies)
     if not found_auth:
-        print(f"[!] Warning: No authentication cookies found in cookie file")
-        print(f"[!] Session may not work properly")
+        log.warning("Warning: No authentication cookies found in cookie file")
+        log.warning("Session may not work properly")
     
     async with BrowserManager(headless=headless, slow_mo=100) as browser:
-        # Navigate to LinkedIn first
-        await browser.page.goto("https://www.linkedin.com")
-        
-        # Add cookies to browser context
-        # Convert cookie format to Playwright format
-        playwright_cookies = []
-        for cookie in cookies:
-            pw_cookie = {
-                'name': cookie['name'],
-                'value': cookie['value'],
-                'domain': cookie.get('domain', '.linkedin.com'),
-                'path': cookie.get('path', '/'),
-            }
-            if cookie.get('expiry'):
-                pw_cookie['expires'] = cookie['expiry']
-            if cookie.get('secure'):
-                pw_cookie['secure'] = cookie['secure']
-            if cookie.get('httpOnly'):
-                pw_cookie['httpOnly'] = cookie['httpOnly']
-            playwright_cookies.append(pw_cookie)
-        
+        # Cookies can be injected into a fresh context without any prior
+        # navigation, so the only page load is the /feed auth check below
+        playwright_cookies = [_to_pw(cookie) for cookie in cookies]
+
         await browser.context.add_cookies(playwright_cookies)
-        print(f"[OK] Injected {len(playwright_cookies)} cookie(s) into browser")
-        
-        # Refresh page to apply cookies
-        await browser.page.reload()
-        await asyncio.sleep(2)
-        
-        # Verify authentication by checking if we're logged in
-        current_url = browser.page.url
-        if 'login' in current_url.lower() or 'authwall' in current_url.lower():
-            print(f"[!] Warning: Still on login page - cookies may be invalid or expired")
-            print(f"[!] Current URL: {current_url}")
-            return False
-        
-        # Navigate to feed to verify authentication
-        await browser.page.goto("https://www.linkedin.com/feed")
-        await asyncio.sleep(2)
+        log.info("Injected %s cookie(s) into browser", len(playwright_cookies))
+
+        # Navigate to feed to verify authentication; wait for either the
+        # logged-in nav or a login link so the URL check below fires as
+        # soon as the page has decided, not after a fixed sleep
+        await browser.page.goto(
+            "https://www.linkedin.com/feed", wait_until="domcontentloaded"
+        )
+        try:
+            await browser.page.wait_for_selector(
+                "nav.global-nav, a[href*='/login']", timeout=8000
+            )
+        except Exception:
+            pass  # fall through to the URL check either way
         
         # Check if we're authenticated
         final_url = browser.page.url
         if 'login' in final_url.lower() or 'authwall' in final_url.lower():
-            print(f"[X] Error: Authentication failed - still redirected to login")
-            print(f"[X] Cookies may be expired or invalid")
+            log.error("Error: Authentication failed - still redirected to login")
+            log.error("Cookies may be expired or invalid")
             return False
         
-        print(f"[OK] Authentication verified - logged in successfully")
+        log.info("Authentication verified - logged in successfully")
         
         # Save session
         await browser.save_session(session_file)
-        print(f"[OK] Session saved to {session_file}")
+        log.info("Session saved to %s", session_file)
         return True
 
 
@@ -128,41 +314,188 @@ async def create_session(
         # Use cookie-based session creation
         success = await create_session_from_cookies(cookie_file, session_file, headless)
         if not success:
-            print(f"[!] Cookie-based session creation failed")
-            print(f"[!] Falling back to manual login...")
+            log.warning("Cookie-based session creation failed")
+            log.warning("Falling back to manual login...")
             # Fall through to manual login
         else:
             return
     
     # Manual login (default)
-    print("[*] Creating LinkedIn session via manual login...")
-    print(f"[*] Headless mode: {headless}")
+    _load_scrapers()
+    log.info("Creating LinkedIn session via manual login...")
+    log.info("Headless mode: %s", headless)
     if not headless:
-        print("[*] Browser will open - please log in manually")
-        print("[*] IMPORTANT: Complete the login process in the browser window")
-        print("[*] The script will wait for you to log in successfully...")
+        log.info("Browser will open - please log in manually")
+        log.info("IMPORTANT: Complete the login process in the browser window")
+        log.info("The script will wait for you to log in successfully...")
     else:
-        print("[!] WARNING: Headless mode is enabled. Browser window will NOT be visible!")
-        print("[!] For manual login, you MUST use --no-headless flag")
+        log.warning("WARNING: Headless mode is enabled. Browser window will NOT be visible!")
+        log.warning("For manual login, you MUST use --no-headless flag")
         # Force headless=False for manual login
         headless = False
     
     async with BrowserManager(headless=headless, slow_mo=100) as browser:
         await browser.page.goto("https://www.linkedin.com/login")
-        print("[*] Waiting for manual login (timeout: 10 minutes)...")
-        print("[*] Please log in to LinkedIn in the browser window that opened")
-        print("[*] The browser window should be visible - complete the login process there")
+        log.info("Waiting for manual login (timeout: 10 minutes)...")
+        log.info("Please log in to LinkedIn in the browser window that opened")
+        log.info("The browser window should be visible - complete the login process there")
         try:
             # Timeout is in milliseconds: 10 minutes = 600000 ms
             await wait_for_manual_login(browser.page, timeout=600000)
         except Exception as e:
-            print(f"[X] Error during login: {e}")
-            print("[!] Please try again and make sure to complete the login process")
+            log.error("Error during login: %s", e)
+            log.warning("Please try again and make sure to complete the login process")
             raise
         
         await browser.save_session(session_file)
-        print(f"[OK] Session saved to {session_file}")
-        print("[OK] You can now use this session file for scraping")
+        log.info("Session saved to %s", session_file)
+        log.info("You can now use this session file for scraping")
+
+
+# Cap on simultaneously open BrowserContexts in multiple mode; each
+# context is cheap next to a browser process but still holds pages and
+# network state
+MAX_PARALLEL = 4
+
+
+# Field mappers built once at import: a bound attrgetter fetches every
+# attribute in one C call and dict(zip(...)) assembles the dict, instead
+# of 8-15 interpreted attribute reads per object (and per experience)
+_PERSON_KEYS = ("name", "headline", "location", "about", "linkedin_url")
+_PERSON_GET = attrgetter(*_PERSON_KEYS)
+_EXP_KEYS = ("title", "company", "location", "description", "start_date", "end_date", "duration")
+_EXP_GET = attrgetter(*_EXP_KEYS)
+_EDU_KEYS = ("school", "degree", "field_of_study", "start_date", "end_date")
+_EDU_GET = attrgetter(*_EDU_KEYS)
+# Company maps the about_us attribute to the "about" output key
+_COMPANY_KEYS = ("name", "industry", "company_size", "headquarters", "founded", "specialties", "about", "linkedin_url")
+_COMPANY_GET = attrgetter("name", "industry", "company_size", "headquarters", "founded", "specialties", "about_us", "linkedin_url")
+_JOB_KEYS = ("title", "company", "location", "description", "employment_type", "seniority_level", "linkedin_url")
+_JOB_GET = attrgetter(*_JOB_KEYS)
+
+
+def _run_stamp() -> tuple:
+    """Capture "now" once per run: (ISO scraped_at, filename tag).
+
+    Computed a single time per batch/invocation so every output of one
+    run carries the same timestamp for correlation, instead of paying
+    two datetime.now() calls per operation.
+    """
+    now = datetime.now()
+    return now.isoformat(), now.strftime("%Y%m%d_%H%M%S")
+
+
+def _person_to_dict(person, scraped_at: Optional[str] = None) -> dict:
+    """Convert a scraped Person to a JSON-serializable dict."""
+    data = dict(zip(_PERSON_KEYS, _PERSON_GET(person)))
+    data["experiences"] = [dict(zip(_EXP_KEYS, _EXP_GET(exp))) for exp in person.experiences]
+    data["educations"] = [dict(zip(_EDU_KEYS, _EDU_GET(edu))) for edu in person.educations]
+    data["skills"] = person.skills
+    data["scraped_at"] = scraped_at or datetime.now().isoformat()
+    return data
+
+
+def _company_to_dict(company, scraped_at: Optional[str] = None) -> dict:
+    """Convert a scraped Company to a JSON-serializable dict."""
+    data = dict(zip(_COMPANY_KEYS, _COMPANY_GET(company)))
+    data["scraped_at"] = scraped_at or datetime.now().isoformat()
+    return data
+
+
+def _job_to_dict(job) -> dict:
+    """Convert a job search result to a JSON-serializable dict.
+
+    JobSearchScraper.search() returns plain job URL strings, so those
+    map to {"linkedin_url": url}; a full job object (should the scraper
+    grow one) takes the attrgetter path.
+    """
+    if isinstance(job, str):
+        return {"linkedin_url": job}
+    return dict(zip(_JOB_KEYS, _JOB_GET(job)))
+
+
+async def scrape_multiple_persons(
+    profile_urls: List[str],
+    session_file: str = "linkedin_session.json",
+    output_file: Optional[str] = None,
+    headless: bool = True,
+    max_parallel: int = MAX_PARALLEL,
+    load_images: bool = False,
+    scraped_at: Optional[str] = None,
+    run_tag: Optional[str] = None,
+):
+    """Scrape multiple LinkedIn person profiles through one browser.
+
+    One Chromium instance is launched and its authenticated storage state
+    is cloned into a fresh BrowserContext per profile, scraped in
+    parallel under a semaphore. This amortizes the multi-second browser
+    cold start across the whole batch and turns N sequential scrapes
+    into ceil(N / max_parallel) rounds.
+    """
+    _load_scrapers()
+    log.info("Scraping %s person profiles...", len(profile_urls))
+    
+    if scraped_at is None or run_tag is None:
+        scraped_at, run_tag = _run_stamp()
+    
+    async with BrowserManager(headless=headless) as browser:
+        # Load session
+        if await asyncio.to_thread(Path(session_file).exists):
+            await browser.load_session(session_file)
+            log.info("Loaded session from %s", session_file)
+        else:
+            log.warning("Session file not found: %s", session_file)
+            log.warning("Please create a session first or log in manually")
+            return
+        
+        # Snapshot the authenticated state once; every parallel context
+        # is seeded from it without touching the session file again
+        state = await browser.context.storage_state()
+        semaphore = asyncio.Semaphore(max_parallel)
+        
+        async def _scrape_one(i: int, profile_url: str):
+            async with semaphore:
+                log.info("Scraping profile %s/%s: %s", i, len(profile_urls), profile_url)
+                context = await browser.browser.new_context(
+                    storage_state=state,
+                    viewport=browser.viewport,
+                )
+                try:
+                    if not load_images:
+                        await _block_heavy_requests(context)
+                    page = await context.new_page()
+                    scraper = PersonScraper(page)
+                    person = await _with_retry(lambda: scraper.scrape(profile_url))
+                    person_data = _person_to_dict(person, scraped_at)
+                    log.info("Scraped: %s - %s", person_data['name'], person_data['headline'])
+                    return person_data
+                except Exception as e:
+                    log.error("Error scraping %s: %s", profile_url, e)
+                    return None
+                finally:
+                    await context.close()
+        
+        results = await asyncio.gather(
+            *(_scrape_one(i, url) for i, url in enumerate(profile_urls, 1))
+        )
+        all_profiles = [p for p in results if p is not None]
+        
+        # Save all profiles to file
+        if not output_file:
+            output_file = f"linkedin_profiles_{run_tag}.json"
+        
+        result = {
+            "total_profiles": len(all_profiles),
+            "profiles": all_profiles,
+            "scraped_at": scraped_at,
+        }
+        
+        await _dump_json_async(output_file, result)
+        
+        log.info("All profiles saved to %s", output_file)
+        log.info("Total profiles scraped: %s", len(all_profiles))
+        
+        return result
 
 
 async def scrape_person(
@@ -170,78 +503,80 @@ async def scrape_person(
     session_file: str = "linkedin_session.json",
     output_file: Optional[str] = None,
     headless: bool = True,
+    use_cache: bool = True,
+    cache_ttl: int = CACHE_TTL,
+    load_images: bool = False,
+    scraped_at: Optional[str] = None,
+    run_tag: Optional[str] = None,
 ):
     """Scrape a LinkedIn person profile"""
-    print(f"[*] Scraping person profile: {profile_url}")
+    _load_scrapers()
+    log.info("Scraping person profile: %s", profile_url)
+    
+    if scraped_at is None or run_tag is None:
+        scraped_at, run_tag = _run_stamp()
+    
+    # Serve from the on-disk cache when the URL was scraped recently
+    if use_cache and cache_get is not None:
+        cached = cache_get(profile_url, cache_ttl)
+        if cached is not None:
+            log.info("Cache hit (scraped %s)", cached.get('scraped_at'))
+            if not output_file:
+                output_file = f"linkedin_person_{run_tag}.json"
+            await _dump_json_async(output_file, cached)
+            log.info("Profile data saved to %s", output_file)
+            return cached
+    
+    # Probe the session over plain HTTP first (once per process): an
+    # expired session fails here in well under a second instead of
+    # after a full browser launch
+    if await _session_alive(session_file) is False:
+        log.error("Error: Session appears expired - the feed hit the authwall")
+        log.warning("Recreate the session with --mode session before scraping")
+        return
     
     async with BrowserManager(headless=headless) as browser:
         # Load session
-        if Path(session_file).exists():
+        if await asyncio.to_thread(Path(session_file).exists):
             await browser.load_session(session_file)
-            print(f"[OK] Loaded session from {session_file}")
+            log.info("Loaded session from %s", session_file)
         else:
-            print(f"[!] Session file not found: {session_file}")
-            print("[!] Please create a session first or log in manually")
+            log.warning("Session file not found: %s", session_file)
+            log.warning("Please create a session first or log in manually")
             return
         
+        if not load_images:
+            await _block_heavy_requests(browser.context)
+        
         # Create scraper
         scraper = PersonScraper(browser.page)
         
         # Scrape profile
         try:
-            person = await scraper.scrape(profile_url)
+            person = await _with_retry(lambda: scraper.scrape(profile_url))
             
             # Convert to dict for JSON serialization
-            person_data = {
-                "name": person.name,
-                "headline": person.headline,
-                "location": person.location,
-                "about": person.about,
-                "linkedin_url": person.linkedin_url,
-                "experiences": [
-                    {
-                        "title": exp.title,
-                        "company": exp.company,
-                        "location": exp.location,
-                        "description": exp.description,
-                        "start_date": exp.start_date,
-                        "end_date": exp.end_date,
-                        "duration": exp.duration,
-                    }
-                    for exp in person.experiences
-                ],
-                "educations": [
-                    {
-                        "school": edu.school,
-                        "degree": edu.degree,
-                        "field_of_study": edu.field_of_study,
-                        "start_date": edu.start_date,
-                        "end_date": edu.end_date,
-                    }
-                    for edu in person.educations
-                ],
-                "skills": person.skills,
-                "scraped_at": datetime.now().isoformat(),
-            }
+            person_data = _person_to_dict(person, scraped_at)
+            
+            if use_cache and cache_put is not None:
+                cache_put(profile_url, person_data)
             
             # Save to file
             if not output_file:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = f"linkedin_person_{timestamp}.json"
+                output_file = f"linkedin_person_{run_tag}.json"
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(person_data, f, indent=2, ensure_ascii=False)
+            await _dump_json_async(output_file, person_data)
             
-            print(f"[OK] Profile data saved to {output_file}")
-            print(f"[*] Name: {person_data['name']}")
-            print(f"[*] Headline: {person_data['headline']}")
-            print(f"[*] Location: {person_data['location']}")
-            print(f"[*] Experiences: {len(person_data['experiences'])}")
-            print(f"[*] Education: {len(person_data['educations'])}")
-            print(f"[*] Skills: {len(person_data['skills'])}")
+            log.info("Profile data saved to %s", output_file)
+            log.info("Name: %s", person_data['name'])
+            log.info("Headline: %s", person_data['headline'])
+            log.info("Location: %s", person_data['location'])
+            log.info("Experiences: %s", len(person_data['experiences']))
+            log.info("Education: %s", len(person_data['educations']))
+            log.info("Skills: %s", len(person_data['skills']))
             
         except Exception as e:
-            print(f"[X] Error scraping profile: {e}")
+            log.error("Error scraping profile: %s", e)
             raise
 
 
@@ -250,56 +585,70 @@ async def scrape_company(
     session_file: str = "linkedin_session.json",
     output_file: Optional[str] = None,
     headless: bool = True,
+    use_cache: bool = True,
+    cache_ttl: int = CACHE_TTL,
+    load_images: bool = False,
+    scraped_at: Optional[str] = None,
+    run_tag: Optional[str] = None,
 ):
     """Scrape a LinkedIn company page"""
-    print(f"[*] Scraping company: {company_url}")
+    _load_scrapers()
+    log.info("Scraping company: %s", company_url)
+    
+    if scraped_at is None or run_tag is None:
+        scraped_at, run_tag = _run_stamp()
+    
+    # Serve from the on-disk cache when the URL was scraped recently
+    if use_cache and cache_get is not None:
+        cached = cache_get(company_url, cache_ttl)
+        if cached is not None:
+            log.info("Cache hit (scraped %s)", cached.get('scraped_at'))
+            if not output_file:
+                output_file = f"linkedin_company_{run_tag}.json"
+            await _dump_json_async(output_file, cached)
+            log.info("Company data saved to %s", output_file)
+            return cached
     
     async with BrowserManager(headless=headless) as browser:
         # Load session
-        if Path(session_file).exists():
+        if await asyncio.to_thread(Path(session_file).exists):
             await browser.load_session(session_file)
-            print(f"[OK] Loaded session from {session_file}")
+            log.info("Loaded session from %s", session_file)
         else:
-            print(f"[!] Session file not found: {session_file}")
-            print("[!] Please create a session first or log in manually")
+            log.warning("Session file not found: %s", session_file)
+            log.warning("Please create a session first or log in manually")
             return
         
+        if not load_images:
+            await _block_heavy_requests(browser.context)
+        
         # Create scraper
         scraper = CompanyScraper(browser.page)
         
         # Scrape company
         try:
-            company = await scraper.scrape(company_url)
+            company = await _with_retry(lambda: scraper.scrape(company_url))
             
             # Convert to dict for JSON serialization
-            company_data = {
-                "name": company.name,
-                "industry": company.industry,
-                "company_size": company.company_size,
-                "headquarters": company.headquarters,
-                "founded": company.founded,
-                "specialties": company.specialties,
-                "about": company.about_us,
-                "linkedin_url": company.linkedin_url,
-                "scraped_at": datetime.now().isoformat(),
-            }
+            company_data = _company_to_dict(company, scraped_at)
+            
+            if use_cache and cache_put is not None:
+                cache_put(company_url, company_data)
             
             # Save to file
             if not output_file:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = f"linkedin_company_{timestamp}.json"
+                output_file = f"linkedin_company_{run_tag}.json"
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(company_data, f, indent=2, ensure_ascii=False)
+            await _dump_json_async(output_file, company_data)
             
-            print(f"[OK] Company data saved to {output_file}")
-            print(f"[*] Company: {company_data['name']}")
-            print(f"[*] Industry: {company_data['industry']}")
-            print(f"[*] Size: {company_data['company_size']}")
-            print(f"[*] Headquarters: {company_data['headquarters']}")
+            log.info("Company data saved to %s", output_file)
+            log.info("Company: %s", company_data['name'])
+            log.info("Industry: %s", company_data['industry'])
+            log.info("Size: %s", company_data['company_size'])
+            log.info("Headquarters: %s", company_data['headquarters'])
             
         except Exception as e:
-            print(f"[X] Error scraping company: {e}")
+            log.error("Error scraping company: %s", e)
             raise
 
 
@@ -310,73 +659,241 @@ async def search_jobs(
     session_file: str = "linkedin_session.json",
     output_file: Optional[str] = None,
     headless: bool = True,
+    load_images: bool = False,
+    scraped_at: Optional[str] = None,
+    run_tag: Optional[str] = None,
 ):
     """Search for LinkedIn jobs"""
-    print(f"[*] Searching jobs: keywords='{keywords}', location='{location}', limit={limit}")
+    _load_scrapers()
+    log.info("Searching jobs: keywords='%s', location='%s', limit=%s", keywords, location, limit)
+    
+    if scraped_at is None or run_tag is None:
+        scraped_at, run_tag = _run_stamp()
     
     async with BrowserManager(headless=headless) as browser:
         # Load session
-        if Path(session_file).exists():
+        if await asyncio.to_thread(Path(session_file).exists):
             await browser.load_session(session_file)
-            print(f"[OK] Loaded session from {session_file}")
+            log.info("Loaded session from %s", session_file)
         else:
-            print(f"[!] Session file not found: {session_file}")
-            print("[!] Please create a session first or log in manually")
+            log.warning("Session file not found: %s", session_file)
+            log.warning("Please create a session first or log in manually")
             return
         
+        if not load_images:
+            await _block_heavy_requests(browser.context)
+        
         # Create scraper
         scraper = JobSearchScraper(browser.page)
         
         # Search jobs
         try:
-            jobs = await scraper.search(
+            # A .jsonl output streams each result to disk as it is
+            # extracted: constant memory regardless of --limit, and the
+            # first job is durable within seconds of the page loading
+            if output_file and output_file.endswith(".jsonl"):
+                header = {
+                    "keywords": keywords,
+                    "location": location,
+                    "scraped_at": scraped_at,
+                }
+                found = 0
+                with open(output_file, "wb", buffering=1 << 20) as f:
+                    f.write(_dumps_line(header) + b"\n")
+                    # search_iter yields job URL strings, not job objects
+                    async for job_url in scraper.search_iter(
+                        keywords=keywords,
+                        location=location,
+                        limit=limit,
+                    ):
+                        f.write(_dumps_line({"linkedin_url": job_url}) + b"\n")
+                        f.flush()
+                        found += 1
+                
+                log.info("Job search results saved to %s", output_file)
+                log.info("Found %s jobs", found)
+                return
+            
+            jobs = await _with_retry(lambda: scraper.search(
                 keywords=keywords,
                 location=location,
                 limit=limit,
-            )
+            ))
             
             # Convert to list of dicts for JSON serialization
-            jobs_data = [
-                {
-                    "title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "description": job.description,
-                    "employment_type": job.employment_type,
-                    "seniority_level": job.seniority_level,
-                    "linkedin_url": job.linkedin_url,
-                }
-                for job in jobs
-            ]
+            jobs_data = [_job_to_dict(job) for job in jobs]
             
             result = {
                 "keywords": keywords,
                 "location": location,
                 "total_results": len(jobs_data),
                 "jobs": jobs_data,
-                "scraped_at": datetime.now().isoformat(),
+                "scraped_at": scraped_at,
             }
             
             # Save to file
             if not output_file:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_file = f"linkedin_jobs_{timestamp}.json"
+                output_file = f"linkedin_jobs_{run_tag}.json"
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            await _dump_json_async(output_file, result)
             
-            print(f"[OK] Job search results saved to {output_file}")
-            print(f"[*] Found {len(jobs_data)} jobs")
+            log.info("Job search results saved to %s", output_file)
+            log.info("Found %s jobs", len(jobs_data))
             
         except Exception as e:
-            print(f"[X] Error searching jobs: {e}")
+            log.error("Error searching jobs: %s", e)
             raise
 
 
+async def run_batch(
+    batch_file: str,
+    session_file: str = "linkedin_session.json",
+    headless: bool = True,
+    load_images: bool = False,
+):
+    """Run a JSONL batch of scrape operations in one browser lifecycle.
+
+    Each line is one operation: {"op": "person"|"company"|"jobs", ...}
+    with the same fields the CLI takes, plus an optional "output" path.
+    The browser launch and session load happen once for the whole file
+    instead of once per operation; "-" reads operations from stdin.
+    """
+    _load_scrapers()
+    if batch_file == "-":
+        lines = sys.stdin.readlines()
+    else:
+        if not await asyncio.to_thread(Path(batch_file).exists):
+            log.error("Error: Batch file not found: %s", batch_file)
+            return
+        lines = (await asyncio.to_thread(Path(batch_file).read_text, "utf-8")).splitlines()
+    
+    ops = [json.loads(line) for line in lines if line.strip()]
+    log.info("Running batch of %s operation(s)", len(ops))
+    
+    async with BrowserManager(headless=headless) as browser:
+        # Load session
+        if await asyncio.to_thread(Path(session_file).exists):
+            await browser.load_session(session_file)
+            log.info("Loaded session from %s", session_file)
+        else:
+            log.warning("Session file not found: %s", session_file)
+            log.warning("Please create a session first or log in manually")
+            return
+        
+        if not load_images:
+            await _block_heavy_requests(browser.context)
+        
+        # Pipeline writes behind scrapes: results go to a background
+        # writer task, so the disk write of operation N overlaps the
+        # network fetch of operation N+1
+        write_q: asyncio.Queue = asyncio.Queue(maxsize=8)
+        writer_task = asyncio.create_task(_write_files(write_q))
+        
+        # One timestamp for the whole batch: outputs correlate by tag and
+        # the per-op datetime.now()/strftime pair disappears from the loop
+        scraped_at, run_tag = _run_stamp()
+        
+        completed = 0
+        for i, op in enumerate(ops, 1):
+            kind = op.get("op")
+            log.info("[%s/%s] %s: %s", i, len(ops), kind, op.get('url') or op.get('keywords'))
+            try:
+                if kind == "person":
+                    person = await _with_retry(
+                        lambda: PersonScraper(browser.page).scrape(op["url"])
+                    )
+                    data = _person_to_dict(person, scraped_at)
+                    if cache_put is not None:
+                        cache_put(op["url"], data)
+                elif kind == "company":
+                    company = await _with_retry(
+                        lambda: CompanyScraper(browser.page).scrape(op["url"])
+                    )
+                    data = _company_to_dict(company, scraped_at)
+                    if cache_put is not None:
+                        cache_put(op["url"], data)
+                elif kind == "jobs":
+                    jobs = await _with_retry(lambda: JobSearchScraper(browser.page).search(
+                        keywords=op["keywords"],
+                        location=op.get("location"),
+                        limit=op.get("limit", 10),
+                    ))
+                    data = {
+                        "keywords": op["keywords"],
+                        "location": op.get("location"),
+                        "total_results": len(jobs),
+                        "jobs": [_job_to_dict(job) for job in jobs],
+                        "scraped_at": scraped_at,
+                    }
+                else:
+                    log.error("Error: Unknown op in batch line %s: %s", i, kind)
+                    continue
+            except Exception as e:
+                log.error("Error on batch line %s: %s", i, e)
+                continue
+            
+            output_file = op.get("output")
+            if not output_file:
+                output_file = f"linkedin_{kind}_{run_tag}_{i}.json"
+            await write_q.put((output_file, _dumps_json(data)))
+            completed += 1
+        
+        await write_q.join()
+        writer_task.cancel()
+        
+        log.info("Batch finished: %s/%s operation(s) succeeded", completed, len(ops))
+
+
+async def scrape_via_daemon(
+    payload: dict,
+    output_prefix: str,
+    output_file: Optional[str] = None,
+    socket_path: Optional[str] = None,
+):
+    """Send a scrape request to a running linkedin_daemon and save the result.
+
+    The daemon keeps a warm browser and session, so this path skips the
+    per-invocation Chromium launch entirely.
+    """
+    import linkedin_daemon
+
+    socket_path = socket_path or linkedin_daemon.DEFAULT_SOCKET
+    try:
+        response = await linkedin_daemon.request(payload, socket_path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        log.error("Error: No daemon listening on %s", socket_path)
+        log.warning("Start one with: python linkedin_scraper_wrapper.py --mode serve")
+        return None
+    
+    if not response.get("ok"):
+        log.error("Error from daemon: %s", response.get('error'))
+        return None
+    
+    scraped_at, run_tag = _run_stamp()
+    
+    data = response["data"]
+    if payload["op"] == "jobs":
+        data = {
+            "keywords": payload["keywords"],
+            "location": payload.get("location"),
+            "total_results": len(data),
+            "jobs": data,
+            "scraped_at": scraped_at,
+        }
+    
+    if not output_file:
+        output_file = f"linkedin_{output_prefix}_{run_tag}.json"
+    
+    await _dump_json_async(output_file, data)
+    
+    log.info("Data saved to %s", output_file)
+    return data
+
+
 def main():
     parser = argparse.ArgumentParser(description="LinkedIn Scraper Wrapper")
-    parser.add_argument("--mode", choices=["person", "company", "jobs", "session", "multiple"], required=True,
-                       help="Scraping mode")
+    parser.add_argument("--mode", choices=["person", "company", "jobs", "session", "multiple", "serve", "batch"], required=True,
+                       help="Scraping mode (serve runs the warm-browser daemon)")
     parser.add_argument("--url", help="Profile or company URL (for person/company mode)")
     parser.add_argument("--urls", help="Comma-separated list of profile URLs (for multiple mode)")
     parser.add_argument("--keywords", help="Job search keywords (for jobs mode)")
@@ -388,10 +905,32 @@ def main():
     parser.add_argument("--no-headless", dest="headless", action="store_false", help="Show browser window")
     parser.add_argument("--cookies", help="Cookie file path (for automatic session creation)")
     parser.add_argument("--cookie-file", dest="cookies", help="Alias for --cookies")
+    parser.add_argument("--batch-file", help="JSONL operations file for batch mode ('-' for stdin)")
+    parser.add_argument("--load-images", action="store_true",
+                       help="Load images/fonts/media instead of blocking them (debugging)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Disable the on-disk scrape cache entirely")
+    parser.add_argument("--fresh", action="store_true",
+                       help="Ignore cached results but still refresh the cache")
+    parser.add_argument("--cache-ttl", type=int, default=CACHE_TTL,
+                       help=f"Cache freshness window in seconds (default: {CACHE_TTL})")
+    parser.add_argument("--use-daemon", action="store_true",
+                       help="Dispatch to a running daemon instead of launching a browser")
+    parser.add_argument("--socket", help="Daemon unix socket path (default: /tmp/linkedin_scraper.sock)")
+    parser.add_argument("--quiet", action="store_true",
+                       help="Only log warnings and errors")
     parser.add_argument("--mock", action="store_true", help=argparse.SUPPRESS)  # Hidden flag
     
     args = parser.parse_args()
     
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else os.environ.get("LINKEDIN_LOG", "INFO"),
+        format="%(message)s",
+    )
+    if os.environ.get("LINKEDIN_LOG_JSON") == "1":
+        for handler in logging.getLogger().handlers:
+            handler.setFormatter(_JsonLogFormatter())
+    
     # If mock mode, use mock scraper
     if args.mock:
         try:
@@ -404,57 +943,115 @@ def main():
             
             if args.mode == "person":
                 if not args.url:
-                    print("[X] Error: --url is required for person mode")
+                    log.error("Error: --url is required for person mode")
                     sys.exit(1)
                 asyncio.run(mock_scrape_person(args.url, args.output))
             elif args.mode == "multiple":
                 if not args.urls:
-                    print("[X] Error: --urls is required for multiple mode")
+                    log.error("Error: --urls is required for multiple mode")
                     sys.exit(1)
-                urls = [url.strip() for url in args.urls.split(",")]
+                urls = _dedupe_urls(_validate_urls([url.strip() for url in args.urls.split(",")]))
                 asyncio.run(mock_scrape_multiple_profiles(urls, args.output))
             elif args.mode == "company":
                 if not args.url:
-                    print("[X] Error: --url is required for company mode")
+                    log.error("Error: --url is required for company mode")
                     sys.exit(1)
                 asyncio.run(mock_scrape_company(args.url, args.output))
             elif args.mode == "jobs":
                 if not args.keywords:
-                    print("[X] Error: --keywords is required for jobs mode")
+                    log.error("Error: --keywords is required for jobs mode")
                     sys.exit(1)
                 asyncio.run(mock_search_jobs(args.keywords, args.location, args.limit, args.output))
             elif args.mode == "session":
-                print("[X] Error: Mock mode does not support session creation")
+                log.error("Error: Mock mode does not support session creation")
                 sys.exit(1)
             return
         except ImportError as e:
-            print(f"[X] Error: Could not import mock scraper: {e}")
+            log.error("Error: Could not import mock scraper: %s", e)
             sys.exit(1)
     
+    if args.mode == "batch":
+        if not args.batch_file:
+            log.error("Error: --batch-file is required for batch mode")
+            sys.exit(1)
+        asyncio.run(run_batch(args.batch_file, args.session, args.headless,
+                              load_images=args.load_images))
+        return
+    
+    if args.mode == "serve":
+        from linkedin_daemon import serve, DEFAULT_SOCKET
+        asyncio.run(serve(args.socket or DEFAULT_SOCKET, args.session, args.headless))
+        return
+    
+    if args.use_daemon and args.mode in ("person", "company", "jobs"):
+        if args.mode in ("person", "company") and not args.url:
+            log.error("Error: --url is required for %s mode", args.mode)
+            sys.exit(1)
+        if args.mode == "jobs" and not args.keywords:
+            log.error("Error: --keywords is required for jobs mode")
+            sys.exit(1)
+        if args.mode == "jobs":
+            payload = {"op": "jobs", "keywords": args.keywords,
+                       "location": args.location, "limit": args.limit}
+        else:
+            payload = {"op": args.mode, "url": args.url}
+        result = asyncio.run(scrape_via_daemon(payload, args.mode, args.output, args.socket))
+        if result is None:
+            sys.exit(1)
+        return
+    
+    # One stamp for the whole invocation; every output shares it
+    run_iso, run_tag = _run_stamp()
+    
     if args.mode == "session":
         # For session creation, always use non-headless (manual login requires visible browser)
         # But respect --headless flag if explicitly set (though it doesn't make sense for manual login)
         session_headless = args.headless
         if session_headless:
-            print("[!] WARNING: Session creation with headless=True doesn't make sense for manual login")
-            print("[!] Forcing headless=False for session creation")
+            log.warning("WARNING: Session creation with headless=True doesn't make sense for manual login")
+            log.warning("Forcing headless=False for session creation")
             session_headless = False
         asyncio.run(create_session(args.session, headless=session_headless))
     elif args.mode == "person":
         if not args.url:
-            print("[X] Error: --url is required for person mode")
+            log.error("Error: --url is required for person mode")
             sys.exit(1)
-        asyncio.run(scrape_person(args.url, args.session, args.output, args.headless))
+        if not _LI_URL_RE.match(args.url):
+            log.warning("URL does not look like a LinkedIn profile: %s", args.url)
+        asyncio.run(scrape_person(args.url, args.session, args.output, args.headless,
+                                  use_cache=not args.no_cache,
+                                  cache_ttl=0 if args.fresh else args.cache_ttl,
+                                  load_images=args.load_images,
+                                  scraped_at=run_iso, run_tag=run_tag))
     elif args.mode == "company":
         if not args.url:
-            print("[X] Error: --url is required for company mode")
+            log.error("Error: --url is required for company mode")
+            sys.exit(1)
+        if not _LI_URL_RE.match(args.url):
+            log.warning("URL does not look like a LinkedIn company page: %s", args.url)
+        asyncio.run(scrape_company(args.url, args.session, args.output, args.headless,
+                                   use_cache=not args.no_cache,
+                                   cache_ttl=0 if args.fresh else args.cache_ttl,
+                                   load_images=args.load_images,
+                                   scraped_at=run_iso, run_tag=run_tag))
+    elif args.mode == "multiple":
+        if not args.urls:
+            log.error("Error: --urls is required for multiple mode")
+            sys.exit(1)
+        urls = _dedupe_urls(_validate_urls([url.strip() for url in args.urls.split(",")]))
+        if not urls:
+            log.error("Error: No valid LinkedIn URLs in --urls")
             sys.exit(1)
-        asyncio.run(scrape_company(args.url, args.session, args.output, args.headless))
+        asyncio.run(scrape_multiple_persons(urls, args.session, args.output, args.headless,
+                                            load_images=args.load_images,
+                                            scraped_at=run_iso, run_tag=run_tag))
     elif args.mode == "jobs":
         if not args.keywords:
-            print("[X] Error: --keywords is required for jobs mode")
+            log.error("Error: --keywords is required for jobs mode")
             sys.exit(1)
-        asyncio.run(search_jobs(args.keywords, args.location, args.limit, args.session, args.output, args.headless))
+        asyncio.run(search_jobs(args.keywords, args.location, args.limit, args.session,
+                                args.output, args.headless, load_images=args.load_images,
+                                scraped_at=run_iso, run_tag=run_tag))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn HTTP Fast Path
+Fetches LinkedIn pages with httpx and the authenticated session cookies,
+without paying for a browser process. Used to probe session validity and
+fetch raw HTML; anything that needs a rendered DOM stays on Playwright.
+"""
+
+import asyncio
+import json
+from typing import Iterable, Optional
+
+# httpx is optional; callers check `httpx is not None` (or catch the
+# RuntimeError from build_client) and fall back to the browser path
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Substrings that mark a logged-out/gated response; authenticated profile
+# pages are also consistently larger than this floor
+AUTHWALL_MARKERS = ("authwall", "uas/login", "session_redirect")
+MIN_PAGE_BYTES = 20_000
+
+# Endpoint used to check session validity: /feed redirects to the login
+# wall when logged out, and probing it avoids an extra LinkedIn-visible
+# request against the profile that is about to be scraped anyway
+PROBE_URL = "https://www.linkedin.com/feed/"
+
+
+def build_client(cookies: Iterable[dict]) -> "httpx.AsyncClient":
+    """Build an async HTTP client carrying the given browser cookies.
+
+    Accepts cookies in the Playwright/storage-state shape
+    ({name, value, domain, path, ...}). The client reuses one connection
+    pool (HTTP/2 when available), so callers should share it across
+    requests rather than rebuilding per fetch.
+    """
+    if httpx is None:
+        raise RuntimeError("httpx is not installed")
+
+    jar = httpx.Cookies()
+    for cookie in cookies:
+        jar.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ".linkedin.com"),
+            path=cookie.get("path", "/"),
+        )
+
+    return httpx.AsyncClient(
+        cookies=jar,
+        http2=True,
+        follow_redirects=True,
+        headers={
+            "User-Agent": USER_AGENT,
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+        timeout=30.0,
+    )
+
+
+def client_from_session(session_file: str) -> "httpx.AsyncClient":
+    """Build a client from a saved Playwright storage-state session file."""
+    with open(session_file, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    return build_client(state.get("cookies", []))
+
+
+def is_gated(html: str, final_url: str = "") -> bool:
+    """True when a response looks like the authwall/login wall."""
+    low_url = final_url.lower()
+    if any(marker in low_url for marker in AUTHWALL_MARKERS):
+        return True
+    if len(html) < MIN_PAGE_BYTES:
+        return True
+    head = html[:4096].lower()
+    return any(marker in head for marker in AUTHWALL_MARKERS)
+
+
+async def fetch(url: str, client: "httpx.AsyncClient") -> str:
+    """Fetch one URL through the shared client, raising on HTTP errors."""
+    response = await client.get(url)
+    response.raise_for_status()
+    return response.text
+
+
+async def fetch_page_html(url: str, client: "httpx.AsyncClient") -> Optional[str]:
+    """Fetch a page, returning None when the response is authwalled."""
+    response = await client.get(url)
+    response.raise_for_status()
+    html = response.text
+    if is_gated(html, str(response.url)):
+        return None
+    return html
+
+
+async def probe_session(session_file: str, url: str = PROBE_URL) -> Optional[bool]:
+    """Check whether the saved session still authenticates.
+
+    Returns True when the probe page comes back ungated, False when it
+    hits the authwall (session expired/invalid), and None when the
+    check could not be performed (httpx missing, network error) -
+    callers should treat None as "unknown" and proceed normally. The
+    session file is read in a worker thread so the event loop never
+    blocks on disk.
+    """
+    if httpx is None:
+        return None
+    try:
+        client = await asyncio.to_thread(client_from_session, session_file)
+        async with client:
+            return await fetch_page_html(url, client) is not None
+    except Exception:
+        return None